@@ -10,77 +10,268 @@ Developer: 8roku8.hl
 """
 
 from web3 import Web3
+from eth_abi import decode as abi_decode, encode as abi_encode
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from collections import deque
+import threading
+from functools import lru_cache
+import json
+import os
+import struct
+import atexit
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from constants import (
-    POOL_ABI, ALGEBRA_POOL_ABI_V1, ALGEBRA_POOL_ABI_V3, MINIMAL_POOL_ABI,
-    TOKEN_ABI, POSITION_MANAGER_ABI, FACTORY_ABI, ALGEBRA_FACTORY_ABI,
-    TOKEN_SYMBOL_MAPPINGS, KNOWN_TOKENS, MULTICALL3_ADDRESS, MULTICALL3_ABI
+    MINIMAL_POOL_ABI,
+    POSITION_MANAGER_ABI, FACTORY_ABI, ALGEBRA_FACTORY_ABI,
+    TOKEN_SYMBOL_MAPPINGS, STATIC_TOKEN_DEFINITIONS, MULTICALL3_ADDRESS, MULTICALL3_ABI,
+    TOKEN_CACHE_FILE, POSITIONS_SELECTOR, TOKEN_OF_OWNER_BY_INDEX_SELECTOR,
+    BALANCE_OF_SELECTOR, COLLECT_SELECTOR, SLOT0_SELECTOR, GLOBAL_STATE_SELECTOR,
+    TOKEN0_SELECTOR, TOKEN1_SELECTOR, DECIMALS_SELECTOR, SYMBOL_SELECTOR, NAME_SELECTOR,
+    POOL_BY_PAIR_SELECTOR, GET_POOL_SELECTOR, GET_BLOCK_NUMBER_SELECTOR,
+    TRANSFER_TOPIC, INCREASE_LIQUIDITY_TOPIC, DECREASE_LIQUIDITY_TOPIC, EVENT_REORG_OVERLAP_BLOCKS,
+    LOG_RANGE_ERROR_HINTS,
+    RATE_LIMIT_ERROR_HINTS, MULTICALL_SPLIT_ERROR_HINTS,
+    COLLECT_INPUT_TYPES, COLLECT_OUTPUT_TYPES
 )
 from utils import (
     sqrt_price_to_price, tick_to_price, calculate_token_amounts,
     calculate_theoretical_amounts, apply_symbol_mapping,
-    parse_algebra_raw_data
+    parse_algebra_raw_data, pow10
 )
 from price_utils import is_stablecoin
 
+# Optional faster JSON backend for the batch JSON-RPC hot path
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=4096)
+def to_checksum(address):
+    """Cached Web3.to_checksum_address (it runs keccak on every call)"""
+    return Web3.to_checksum_address(address)
+
+@lru_cache(maxsize=4096)
+def _checksum_from_bytes(address_bytes):
+    """Checksum a raw 20-byte address, cached on the bytes themselves"""
+    return Web3.to_checksum_address(address_bytes)
+
+def address_from_word(word):
+    """Checksummed address from an ABI-encoded 32-byte word (call result or log topic)"""
+    return _checksum_from_bytes(bytes(word[12:32]))
+
+def address_to_word(address):
+    """ABI-encoded 32-byte word for an address, comparable to raw log topics without checksumming them"""
+    return bytes(12) + bytes.fromhex(address[2:])
+
+# Leading (sqrtPriceX96, tick) words of slot0()/globalState(), unpacked without slice copies
+_SQRT_PRICE_TICK_WORDS = struct.Struct('>32s32s')
+
+# (amount0, amount1) words of IncreaseLiquidity data (liquidity, amount0, amount1), skipping liquidity
+_INCREASE_LIQUIDITY_AMOUNT_WORDS = struct.Struct('>32x32s32s')
+
+# The 12 static words of positions() (POSITIONS_OUTPUT_TYPES), unpacked in one call
+_POSITIONS_WORDS = struct.Struct('>' + '32s' * 12)
+_POSITIONS_SIGNED_FIELDS = frozenset((5, 6))  # tickLower, tickUpper (int24)
+_POSITIONS_ADDRESS_FIELDS = frozenset((1, 2, 3))  # operator, token0, token1
+
+# Immutable token fields written to the token cache file; everything else is derived on load
+_PERSISTED_TOKEN_FIELDS = ("decimals", "symbol", "name", "source")
+
+class _BoundedCache(OrderedDict):
+    """Dict that evicts its least recently used entries beyond maxsize (thread-safe)"""
+
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self:
+                return self[key]
+            return default
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
 class BlockchainManager:
     """Manages all blockchain interactions"""
     
-    def __init__(self, rpc_url, debug_mode=False):
+    def __init__(self, rpc_url, debug_mode=False, rpc_batch_size=100, token_cache_file=TOKEN_CACHE_FILE,
+                 pool_maxsize=64, rpm_limit=90):
         self.rpc_url = rpc_url
         self.debug_mode = debug_mode
-        self.token_cache = {}
+        # Token metadata cache: LRU of {address: (info, expires_at)}
+        self.token_cache = OrderedDict()
+        self._token_cache_maxsize = 2048
+        self._token_cache_ttl_seconds = 24 * 60 * 60
+        self._token_cache_fallback_ttl_seconds = 60  # retry failed lookups soon
+        self._token_cache_lock = threading.Lock()
+
+        # JSON-RPC batching (one HTTP POST carries many eth_calls)
+        self._rpc_batch_size = max(1, int(rpc_batch_size or 1))
+        self._batch_concurrency = 4  # batch POSTs in flight at once for large call lists
+        self._call_concurrency = 8  # single calls in flight at once where batching doesn't apply
+
+        # One pooled session shared by web3 and the batch helper; retries transient 429/5xx
+        self._http = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),  # JSON-RPC reads are POSTs
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=max(1, int(pool_maxsize or 1)), max_retries=retry)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)  # the adapter's pool keeps connections alive
         
         # Connect to blockchain
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        self.w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 10}, session=self._http))
+        # web3's validation middleware asks for eth_chainId before every eth_call; the chain id
+        # never changes, so answer it from memory (on every thread) instead of doubling each
+        # call's round-trips
+        self._chain_id = None
+        self.w3.middleware_onion.add(self._chain_id_middleware, "chain_id_cache")
         if not self.w3.is_connected():
             raise Exception("Failed to connect to HyperEVM blockchain")
         
         print("Connected to HyperEVM")
 
-        # Pool data cache (per-cycle TTL)
-        self._pool_cache = {}
+        # Block number -> timestamp; historical blocks never change, so this is persisted too
+        self._block_ts_cache = _BoundedCache(4096)
+        # Per-position history (acquisition time, mint entry) is immutable on-chain and persisted
+        # with the token cache; LRU-bounded so long runs over many positions don't grow without limit
+        self._acquired_ts_cache = _BoundedCache(4096)
+        self._initial_liquidity_cache = _BoundedCache(4096)
+
+        # Persisted token cache (partitioned by chain id); None disables persistence
+        self._token_cache_file = token_cache_file
+        self._token_cache_dirty = False
+        self._token_cache_flush_timer = None
+        self._token_cache_flush_delay = 30  # seconds, debounces writes
+        self._pool_method = {}  # pool -> read method that worked ("v1", "v3", "enhanced_raw", "uniswap_v3")
+        try:
+            self._chain_id = str(self.w3.eth.chain_id)
+        except Exception:
+            self._chain_id = None
+        if self._token_cache_file and self._chain_id:
+            self._load_token_cache()
+            atexit.register(self.flush_token_cache)
+
+        # Pool data cache, invalidated when a new block is seen (TTL as backstop)
+        self._pool_cache = _BoundedCache(4096)
         self._pool_cache_ttl_seconds = 5  # fresh enough for monitoring
-        self._last_cache_block = None
+        self._block_number_cache = (None, 0.0)  # (block, fetched_at), shared within a tick
+        self._block_number_lock = threading.Lock()
+        self._pool_tokens = {}  # pool -> (token0, token1); immutable so never expires
+        self._factory_type_cache = {}  # factory -> detected dex type
+        self._factory_by_position_manager = {}  # position manager -> factory() result
+        self._pool_address_cache = _BoundedCache(4096)  # (factory, token0, token1, fee, type) -> (pool, expires_at)
+        self._pool_not_found_ttl_seconds = 10 * 60  # pools can be created later, so misses expire
+
+        # Registry tokens, built once in the same shape as fetched token info
+        self._static_tokens = {
+            to_checksum(address): self._with_divisors({
+                "decimals": int(definition["decimals"]),
+                "symbol": definition["symbol"],
+                "display_symbol": apply_symbol_mapping(definition["symbol"]),
+                "name": definition.get("name", ""),
+                "source": "known_contract"
+            })
+            for address, definition in STATIC_TOKEN_DEFINITIONS.items()
+        }
+
+        # Contract wrappers keyed by (address, abi identity); ABI parsing is not free
+        self._contract_cache = _BoundedCache(1024)
+        self._contract_factories = {}  # id(abi) -> contract factory; the ABIs are module constants
 
         # Multicall contract (optional)
         try:
-            self.multicall = self.w3.eth.contract(address=Web3.to_checksum_address(MULTICALL3_ADDRESS), abi=MULTICALL3_ABI)
+            self.multicall = self._contract(MULTICALL3_ADDRESS, MULTICALL3_ABI)
         except Exception:
             self.multicall = None
+        self._multicall_checked = False  # bytecode at MULTICALL3_ADDRESS confirmed
+        self._multicall_min_split = 8  # aggregate3 chunks this small are not split further
 
         # Event tracking per DEX
         self._last_event_block_by_dex = {}
         self._last_event_hints_by_dex = {}
         self._last_scan_status_by_dex = {}
+        # Largest eth_getLogs block range known to work with this RPC (halved on rejection)
+        self._logs_chunk_hint = 50_000
+        self._logs_min_chunk = 500
+        # Token IDs held per (wallet, position manager), kept current from Transfer logs
+        self._owned_token_ids = {}
 
-        # Precompute event topic hashes
-        self._topic_transfer = self.w3.keccak(text="Transfer(address,address,uint256)").hex()
-        self._topic_increase = self.w3.keccak(text="IncreaseLiquidity(uint256,uint128,uint256,uint256)").hex()
-        self._topic_decrease = self.w3.keccak(text="DecreaseLiquidity(uint256,uint128,uint256,uint256)").hex()
-        self._acquired_ts_cache = {}
-        self._initial_liquidity_cache = {}
+        # Last collect() result per position, with the block/liquidity/price it was taken at
+        self._fee_cache = _BoundedCache(4096)
 
         # Global RPC rate limiter (tokens/minute)
-        self._rpm_limit = 90  # keep headroom under 100 rpm
-        self._rpc_call_times = deque()
+        self._rpm_limit = int(rpm_limit or 0)  # default 90 keeps headroom under 100 rpm; 0 disables
+        self._rpc_tokens = float(self._rpm_limit)  # start full so a cold start isn't throttled
+        self._rpc_last_refill = time.monotonic()
+        self._rpc_lock = threading.Lock()
+
+    def _contract(self, address, abi):
+        """Return a cached contract wrapper for address/abi"""
+        key = (address.lower(), id(abi))
+        contract = self._contract_cache.get(key)
+        if contract is None:
+            # The ABI is parsed once into a factory class; binding it to another address is cheap
+            factory = self._contract_factories.get(id(abi))
+            if factory is None:
+                factory = self._contract_factories[id(abi)] = self.w3.eth.contract(abi=abi)
+            contract = factory(address=to_checksum(address))
+            self._contract_cache[key] = contract
+        return contract
 
     def _throttle_rpc(self):
-        """Simple token-bucket-like limiter to keep under rpm limit."""
+        """Token-bucket limiter to keep under rpm limit.
+
+        Each caller reserves a token under the lock (the balance may go
+        negative) and sleeps off its share of the debt outside it, so
+        concurrent callers wait in parallel instead of queueing behind
+        one sleeper.
+        """
         if self._rpm_limit <= 0:
             return
-        now = time.time()
-        window = 60.0
-        # drop old
-        while self._rpc_call_times and (now - self._rpc_call_times[0]) > window:
-            self._rpc_call_times.popleft()
-        if len(self._rpc_call_times) >= self._rpm_limit:
-            sleep_for = window - (now - self._rpc_call_times[0]) + 0.05
-            if sleep_for > 0:
-                time.sleep(sleep_for)
-        # record
-        self._rpc_call_times.append(time.time())
+        rate = self._rpm_limit / 60.0  # tokens per second
+        with self._rpc_lock:
+            now = time.monotonic()
+            self._rpc_tokens = min(float(self._rpm_limit),
+                                   self._rpc_tokens + (now - self._rpc_last_refill) * rate)
+            self._rpc_last_refill = now
+            self._rpc_tokens -= 1.0
+            sleep_for = -self._rpc_tokens / rate if self._rpc_tokens < 0 else 0.0
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+
+    def _chain_id_middleware(self, make_request, w3):
+        """web3 middleware answering eth_chainId from self._chain_id once it is known"""
+        def middleware(method, params):
+            if method == "eth_chainId" and self._chain_id is not None:
+                return {"jsonrpc": "2.0", "id": 0, "result": hex(int(self._chain_id))}
+            return make_request(method, params)
+        return middleware
 
     def _rl_call(self, fn, *args, **kwargs):
         try:
@@ -94,65 +285,380 @@ class BlockchainManager:
                 return fn(*args, **kwargs)
             raise
 
+    @staticmethod
+    def _is_rate_limit_error(e):
+        """True for HTTP 429 or a provider message asking the client to slow down"""
+        response = getattr(e, 'response', None)
+        if getattr(response, 'status_code', None) == 429:
+            return True
+        message = str(e).lower()
+        return any(hint in message for hint in RATE_LIMIT_ERROR_HINTS)
+
+    def _block_tag(self):
+        """Block this tick is pinned to (see refresh_block_number), else "latest".
+        Reads within a tick then share one consistent snapshot.
+        """
+        block_number, fetched_at = self._block_number_cache
+        if block_number is not None and (time.time() - fetched_at) <= self._pool_cache_ttl_seconds:
+            return block_number
+        return "latest"
+
+    def _batch_eth_call(self, calls, block_identifier=None):
+        """Run many eth_calls as JSON-RPC batch requests.
+
+        calls: list of (to_address, calldata_bytes) or (to_address, calldata_bytes, from_address)
+        Returns a list aligned with calls holding the raw return bytes, or None
+        for entries the node reported as failed. Raises if a batch POST fails as
+        a whole (e.g. HTTP 413) so callers can fall back to single calls.
+        """
+        if block_identifier is None:
+            block_identifier = self._block_tag()
+        if isinstance(block_identifier, int):
+            block_identifier = hex(block_identifier)
+        results = [None] * len(calls)
+
+        def _post_chunk(start):
+            chunk = calls[start:start + self._rpc_batch_size]
+            payload = []
+            for offset, call in enumerate(chunk):
+                tx = {"to": call[0], "data": "0x" + bytes(call[1]).hex()}
+                if len(call) > 2 and call[2]:
+                    tx["from"] = call[2]
+                payload.append({
+                    "jsonrpc": "2.0",
+                    "id": start + offset,
+                    "method": "eth_call",
+                    "params": [tx, block_identifier]
+                })
+            self._throttle_rpc()
+            if ORJSON_AVAILABLE:
+                # Replies carry only small ids and hex strings, well inside orjson's 64-bit int limit
+                response = self._http.post(self.rpc_url, data=orjson.dumps(payload), headers=_JSON_HEADERS, timeout=30)
+                response.raise_for_status()
+                replies = orjson.loads(response.content)
+            else:
+                response = self._http.post(self.rpc_url, json=payload, timeout=30)
+                response.raise_for_status()
+                replies = response.json()
+            if not isinstance(replies, list):
+                raise ValueError(f"Unexpected batch response: {str(replies)[:200]}")
+            for reply in replies:
+                idx = reply.get("id")
+                if not isinstance(idx, int) or not (0 <= idx < len(results)):
+                    continue
+                result_hex = reply.get("result")
+                if reply.get("error") is not None or not result_hex or result_hex == "0x":
+                    continue
+                results[idx] = bytes.fromhex(result_hex[2:])
+
+        starts = list(range(0, len(calls), self._rpc_batch_size))
+        if len(starts) <= 1:
+            for start in starts:
+                _post_chunk(start)
+        else:
+            # Several batches: overlap the POSTs instead of paying one RTT each
+            with ThreadPoolExecutor(max_workers=min(self._batch_concurrency, len(starts))) as executor:
+                list(executor.map(_post_chunk, starts))
+        return results
+
+    def _eth_call_raw(self, to, calldata, block_identifier=None):
+        """Single rate-limited eth_call with prebuilt calldata (selector + encoded args); returns raw bytes"""
+        if block_identifier is None:
+            block_identifier = self._block_tag()
+        return bytes(self._rl_call(self.w3.eth.call, {'to': to, 'data': '0x' + bytes(calldata).hex()}, block_identifier))
+
+    @staticmethod
+    def _decode_positions(data):
+        """Decode a raw positions() result into its 12 fields, token addresses checksummed.
+        Every field is a static word, so this reads words directly instead of running the ABI decoder."""
+        decoded = []
+        for field, word in enumerate(_POSITIONS_WORDS.unpack_from(data, 0)):
+            if field in _POSITIONS_ADDRESS_FIELDS:
+                decoded.append(address_from_word(word))
+            else:
+                decoded.append(int.from_bytes(word, 'big', signed=field in _POSITIONS_SIGNED_FIELDS))
+        return decoded
+
+    def _multicall_deployed(self):
+        """Check once that Multicall3 has code on this chain; disables multicall if not"""
+        if not self._multicall_checked:
+            code = bytes(self._rl_call(self.w3.eth.get_code, MULTICALL3_ADDRESS))
+            self._multicall_checked = True
+            if not code:
+                print(f"⚠️  No Multicall3 contract at {MULTICALL3_ADDRESS}, using single calls")
+                self.multicall = None
+        return self.multicall is not None
+
+    def _aggregate3(self, calls, block_identifier):
+        """Multicall3 aggregate3 over (target, allowFailure, callData) calls.
+
+        Returns one (success, returnData) per call. If the aggregate reverts or
+        hits gas or response size limits, the calls are split in half and
+        retried, so one bad chunk only costs its own entries, which come back as
+        failed. Transport errors, HTTP 429/5xx and other failures are raised, as
+        is a missing Multicall3.
+        """
+        try:
+            return self._rl_call(self.multicall.functions.aggregate3(calls).call, block_identifier=block_identifier)
+        except Exception as e:
+            if isinstance(e, requests.exceptions.HTTPError):
+                status = getattr(e.response, 'status_code', None)
+                if status == 429 or (status is not None and status >= 500):
+                    raise
+            elif isinstance(e, requests.exceptions.RequestException):
+                raise  # timeouts and connection errors would fail the halves too
+            if not any(hint in str(e).lower() for hint in MULTICALL_SPLIT_ERROR_HINTS):
+                raise
+            if not self._multicall_deployed():
+                raise
+            if len(calls) <= self._multicall_min_split:
+                if self.debug_mode:
+                    print(f"⚠️  aggregate3 chunk of {len(calls)} calls failed: {e}")
+                return [(False, b"")] * len(calls)
+            mid = len(calls) // 2
+            return (self._aggregate3(calls[:mid], block_identifier)
+                    + self._aggregate3(calls[mid:], block_identifier))
+
+    def _get_cached_token(self, token_address):
+        """Return cached token info, dropping it if expired"""
+        with self._token_cache_lock:
+            entry = self.token_cache.get(token_address)
+            if entry is None:
+                return None
+            info, expires_at = entry
+            if time.time() >= expires_at:
+                del self.token_cache[token_address]
+                return None
+            self.token_cache.move_to_end(token_address)
+            return info
+
+    @staticmethod
+    def _with_divisors(token_info):
+        """Attach 10**decimals once so amount conversions don't recompute it"""
+        decimals = int(token_info.get("decimals", 18))
+        token_info["wei_divisor"] = pow10(decimals)
+        return token_info
+
+    def _set_cached_token(self, token_address, token_info):
+        """Cache token info; fallback entries expire quickly so they get retried"""
+        self._with_divisors(token_info)
+        if token_info.get("source") in ("fallback", "unknown"):
+            ttl = self._token_cache_fallback_ttl_seconds
+        else:
+            ttl = self._token_cache_ttl_seconds
+        with self._token_cache_lock:
+            self.token_cache[token_address] = (token_info, time.time() + ttl)
+            self.token_cache.move_to_end(token_address)
+            while len(self.token_cache) > self._token_cache_maxsize:
+                self.token_cache.popitem(last=False)
+        if token_info.get("source") == "contract_call":
+            self._schedule_token_cache_flush()
+
+    @staticmethod
+    def _decode_token_string(data):
+        """Decode a symbol()/name() result, accepting both string and legacy bytes32 returns"""
+        if not data:
+            return None
+        try:
+            return abi_decode(["string"], data)[0]
+        except Exception:
+            pass
+        if len(data) == 32:
+            value = data.rstrip(b"\x00").decode("utf-8", "ignore")
+            return value or None
+        return None
+
+    def _fetch_token_metadata_bulk(self, addresses):
+        """Fetch decimals/symbol/name for many tokens in one batched round-trip
+        and store them in token_cache. Tokens that fail entirely are left for
+        get_enhanced_token_info to handle with its usual fallback.
+        """
+        addresses = [to_checksum(a) for a in addresses]
+        addresses = [a for a in dict.fromkeys(addresses)
+                     if a not in self._static_tokens and self._get_cached_token(a) is None]
+        if not addresses:
+            return
+
+        calls = []
+        for address in addresses:
+            calls.append((address, DECIMALS_SELECTOR))
+            calls.append((address, SYMBOL_SELECTOR))
+            calls.append((address, NAME_SELECTOR))
+
+        try:
+            results = self._batch_eth_call(calls)
+        except Exception as e:
+            if self.debug_mode:
+                print(f"⚠️  Batch token metadata lookup failed: {e}")
+            return
+
+        for n, address in enumerate(addresses):
+            token_info = self._parse_token_metadata(address, *results[3 * n:3 * n + 3])
+            if token_info is not None:
+                self._set_cached_token(address, token_info)
+
+    def _parse_token_metadata(self, address, decimals_data, symbol_data, name_data):
+        """Build token info from raw decimals()/symbol()/name() results; None if all failed"""
+        if decimals_data is None and symbol_data is None and name_data is None:
+            return None
+
+        decimals = 18  # Default fallback
+        if decimals_data and len(decimals_data) >= 32:
+            decimals = int.from_bytes(decimals_data[:32], 'big')
+        # Fallback to truncated address if symbol fails
+        symbol = self._decode_token_string(symbol_data) or f"TOKEN_{address[-6:]}"
+        token_name = self._decode_token_string(name_data) or ""
+
+        return {
+            "decimals": decimals,
+            "symbol": symbol,
+            "display_symbol": apply_symbol_mapping(symbol),  # e.g., WHYPE -> HYPE
+            "name": token_name,
+            "source": "contract_call"
+        }
+
+    def _read_token_cache_file(self):
+        try:
+            with open(self._token_cache_file, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _load_token_cache(self):
+        """Load persisted token metadata, pool read methods, block timestamps and position history for this chain, skipping expired entries"""
+        now = time.time()
+        chain_data = self._read_token_cache_file().get(self._chain_id, {})
+        entries = chain_data.get("tokens", {})
+        self._pool_method.update(chain_data.get("pool_methods", {}))
+        for block_number, ts in chain_data.get("block_timestamps", {}).items():
+            try:
+                self._block_ts_cache[int(block_number)] = int(ts)
+            except (TypeError, ValueError):
+                continue
+        # Keys are "token_id:position_manager[:wallet]", mirroring the in-memory tuple keys
+        for key, ts in chain_data.get("acquired_timestamps", {}).items():
+            try:
+                token_id, position_manager, wallet = key.split(":")
+                self._acquired_ts_cache[(int(token_id), position_manager, wallet)] = int(ts)
+            except (TypeError, ValueError):
+                continue
+        for key, entry in chain_data.get("initial_entries", {}).items():
+            try:
+                token_id, position_manager = key.split(":")
+                if isinstance(entry, dict):
+                    self._initial_liquidity_cache[(int(token_id), position_manager)] = entry
+            except (TypeError, ValueError):
+                continue
+        with self._token_cache_lock:
+            for address, entry in entries.items():
+                try:
+                    if entry["expires_at"] > now:
+                        info = {k: entry["info"][k] for k in _PERSISTED_TOKEN_FIELDS if k in entry["info"]}
+                        # Re-derive so edits to TOKEN_SYMBOL_MAPPINGS apply to cached tokens too
+                        info["display_symbol"] = apply_symbol_mapping(info["symbol"])
+                        self.token_cache[address] = (self._with_divisors(info), entry["expires_at"])
+                except (KeyError, TypeError):
+                    continue
+        if self.debug_mode and entries:
+            print(f"🔍 Loaded {len(self.token_cache)} cached tokens from {self._token_cache_file}")
+
+    def _schedule_token_cache_flush(self):
+        """Mark the persisted cache dirty and flush it after a short delay"""
+        if not self._token_cache_file or not self._chain_id:
+            return
+        with self._token_cache_lock:
+            self._token_cache_dirty = True
+            if self._token_cache_flush_timer is not None:
+                return
+            timer = threading.Timer(self._token_cache_flush_delay, self.flush_token_cache)
+            timer.daemon = True
+            self._token_cache_flush_timer = timer
+        timer.start()
+
+    def flush_token_cache(self):
+        """Write successful token lookups, pool read methods, block timestamps and position history to disk
+        (fallback entries and failed lookups are not persisted)"""
+        with self._token_cache_lock:
+            self._token_cache_flush_timer = None
+            if not self._token_cache_dirty:
+                return
+            self._token_cache_dirty = False
+            entries = {
+                address: {"info": {k: info[k] for k in _PERSISTED_TOKEN_FIELDS if k in info}, "expires_at": expires_at}
+                for address, (info, expires_at) in self.token_cache.items()
+                if info.get("source") == "contract_call"
+            }
+        with self._block_ts_cache._lock:
+            block_timestamps = {str(bn): ts for bn, ts in list(self._block_ts_cache.items())}
+        with self._acquired_ts_cache._lock:
+            acquired_timestamps = {
+                ":".join(map(str, key)): ts for key, ts in list(self._acquired_ts_cache.items()) if ts
+            }
+        with self._initial_liquidity_cache._lock:
+            # Entries without a historical price may succeed later against an archive node
+            initial_entries = {
+                ":".join(map(str, key)): entry for key, entry in list(self._initial_liquidity_cache.items())
+                if entry and entry.get("entry_price")
+            }
+
+        # Keep other chains' entries, and unexpired tokens the in-memory LRU has since evicted;
+        # write atomically so concurrent runs never see a partial file
+        data = self._read_token_cache_file()
+        now = time.time()
+        previous = data.get(self._chain_id, {}).get("tokens", {})
+        if isinstance(previous, dict):
+            for address, entry in previous.items():
+                try:
+                    if address not in entries and entry["expires_at"] > now:
+                        entries[address] = entry
+                except (KeyError, TypeError):
+                    continue
+        data[self._chain_id] = {
+            "tokens": entries,
+            "pool_methods": dict(self._pool_method),
+            "block_timestamps": block_timestamps,
+            "acquired_timestamps": acquired_timestamps,
+            "initial_entries": initial_entries,
+        }
+        tmp_path = f"{self._token_cache_file}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._token_cache_file)
+        except OSError as e:
+            if self.debug_mode:
+                print(f"⚠️  Could not save token cache: {e}")
+
     def get_enhanced_token_info(self, token_address, dex_name=""):
         """Enhanced token info with better symbol detection and mapping"""
         # Normalize address for caching
-        token_address = Web3.to_checksum_address(token_address)
+        token_address = to_checksum(token_address)
         
         # Check known tokens first
-        if token_address in KNOWN_TOKENS:
-            symbol = KNOWN_TOKENS[token_address]
-            return {
-                "decimals": 18,  # You might want to still call for decimals
-                "symbol": symbol,
-                "display_symbol": symbol,
-                "source": "known_contract"
-            }
+        static_info = self._static_tokens.get(token_address)
+        if static_info is not None:
+            return static_info
         
-        if token_address in self.token_cache:
-            cached_info = self.token_cache[token_address]
-            # Apply symbol mapping to cached results
-            display_symbol = apply_symbol_mapping(cached_info["symbol"])
-            cached_info["display_symbol"] = display_symbol
+        cached_info = self._get_cached_token(token_address)
+        if cached_info is not None:
+            # display_symbol is mapped when the entry is built (fetch or cache-file load)
+            if self.debug_mode and cached_info["display_symbol"] != apply_symbol_mapping(cached_info["symbol"]):
+                print(f"⚠️  Stale display symbol cached for {token_address[:8]}...: {cached_info['display_symbol']}")
             return cached_info
         
         try:
-            token_contract = self.w3.eth.contract(
-                address=token_address,
-                abi=TOKEN_ABI
-            )
+            # decimals/symbol/name in one batched round-trip; failed entries come back as None
+            results = self._batch_eth_call([
+                (token_address, DECIMALS_SELECTOR),
+                (token_address, SYMBOL_SELECTOR),
+                (token_address, NAME_SELECTOR)
+            ])
+            token_info = self._parse_token_metadata(token_address, *results)
+            if token_info is None:
+                raise ValueError("decimals(), symbol() and name() all failed")
             
-            # Get decimals and symbol in one try-catch block
-            try:
-                decimals = token_contract.functions.decimals().call()
-            except:
-                decimals = 18  # Default fallback
-                
-            try:
-                symbol = token_contract.functions.symbol().call()
-            except:
-                # Fallback to truncated address if symbol fails
-                symbol = f"TOKEN_{token_address[-6:]}"
-            
-            # Try to get token name for better identification
-            token_name = ""
-            try:
-                token_name = token_contract.functions.name().call()
-            except:
-                pass
-            
-            # Apply symbol mapping (e.g., WHYPE -> HYPE)
-            display_symbol = apply_symbol_mapping(symbol)
-            
-            token_info = {
-                "decimals": decimals,
-                "symbol": symbol,
-                "display_symbol": display_symbol,
-                "name": token_name,
-                "source": "contract_call"
-            }
-            
-            self.token_cache[token_address] = token_info
+            self._set_cached_token(token_address, token_info)
             return token_info
             
         except Exception as e:
@@ -165,58 +671,83 @@ class BlockchainManager:
                 "name": "",
                 "source": "fallback"
             }
-            self.token_cache[token_address] = token_info
+            self._set_cached_token(token_address, token_info)
             print(f"⚠️  Using fallback info for token {token_address[:8]}...: {e}")
             return token_info
 
+    def _fee_cache_state(self, position):
+        """(block, liquidity, pool sqrtPriceX96) used to decide if cached fees still hold"""
+        block_number = self._block_number_cache[0]
+        sqrt_price = None
+        pool_address = position.get("pool_address")
+        if pool_address:
+            cached = self._pool_cache.get((to_checksum(pool_address), position.get("dex_type", "uniswap_v3")))
+            # Only trust pool data read at the current block
+            if cached and block_number is not None and cached[2] == block_number:
+                sqrt_price = cached[0].get("sqrt_price_x96")
+        return block_number, position.get("liquidity"), sqrt_price
+
+    def _get_cached_fee_data(self, position):
+        """Return last fee data if nothing that could accrue fees has changed, else None.
+
+        Same block: reuse whatever we had. Otherwise only zero-fee results are reused,
+        and only while liquidity and pool price are unchanged (no swaps through the pool).
+        """
+        entry = self._fee_cache.get((position["position_manager"], position["token_id"]))
+        if not entry:
+            return None
+        block_number, liquidity, sqrt_price = self._fee_cache_state(position)
+        if block_number is not None and entry["last_block"] == block_number:
+            return entry["fee_data"]
+        if (not entry["fee_data"].get("has_fees")
+                and sqrt_price is not None
+                and liquidity == entry["last_liquidity"]
+                and sqrt_price == entry["last_sqrt_price"]):
+            entry["last_block"] = block_number
+            return entry["fee_data"]
+        return None
+
+    def _store_fee_data(self, position, fee_data):
+        block_number, liquidity, sqrt_price = self._fee_cache_state(position)
+        self._fee_cache[(position["position_manager"], position["token_id"])] = {
+            "last_block": block_number,
+            "last_liquidity": liquidity,
+            "last_sqrt_price": sqrt_price,
+            "fee_data": fee_data
+        }
+
+    @staticmethod
+    def _collect_call(position, wallet_address):
+        """(to, calldata, from) for a static collect() of everything owed, recipient = wallet"""
+        max_uint128 = (2**128) - 1  # Collect all available
+        wallet_cs = to_checksum(wallet_address)
+        params = abi_encode(
+            COLLECT_INPUT_TYPES,
+            [(int(position["token_id"]), wallet_cs, max_uint128, max_uint128)]
+        )
+        return to_checksum(position["position_manager"]), COLLECT_SELECTOR + params, wallet_cs
+
     def get_unclaimed_fees(self, position, wallet_address):
         """Get unclaimed fees using static collect() call"""
+        cached_fees = self._get_cached_fee_data(position)
+        if cached_fees is not None:
+            return cached_fees
+
         try:
-            position_manager = self.w3.eth.contract(
-                address=Web3.to_checksum_address(position["position_manager"]),
-                abi=POSITION_MANAGER_ABI
-            )
-            
-            # Prepare collect parameters for maximum collection
-            max_uint128 = (2**128) - 1  # Maximum value for uint128
-            
-            collect_params = {
-                "tokenId": position["token_id"],
-                "recipient": wallet_address,  # Use wallet as recipient
-                "amount0Max": max_uint128,    # Collect all available
-                "amount1Max": max_uint128     # Collect all available
-            }
-            
             if self.debug_mode:
                 print(f"🔍 Getting fees for token ID {position['token_id']} using static call...")
             
             # Use static call to simulate fee collection without executing
-            result = position_manager.functions.collect(collect_params).call(
-                {'from': wallet_address}
+            to, calldata, sender = self._collect_call(position, wallet_address)
+            raw_result = self.w3.eth.call(
+                {'to': to, 'from': sender, 'data': '0x' + calldata.hex()}, self._block_tag()
             )
             
             # Result is a tuple (amount0, amount1) in wei
-            fee_amount0_wei = result[0]
-            fee_amount1_wei = result[1]
-            
-            # Convert from wei to human-readable amounts
-            decimals0 = position["token0_info"]["decimals"]
-            decimals1 = position["token1_info"]["decimals"]
-            
-            fee_amount0 = fee_amount0_wei / (10 ** decimals0)
-            fee_amount1 = fee_amount1_wei / (10 ** decimals1)
-            
-            if self.debug_mode:
-                print(f"🔍 Raw fees: {fee_amount0_wei} wei token0, {fee_amount1_wei} wei token1")
-                print(f"🔍 Human fees: {fee_amount0} {position['token0_symbol']}, {fee_amount1} {position['token1_symbol']}")
-            
-            return {
-                "fee_amount0": fee_amount0,
-                "fee_amount1": fee_amount1,
-                "fee_amount0_wei": fee_amount0_wei,
-                "fee_amount1_wei": fee_amount1_wei,
-                "has_fees": fee_amount0 > 0 or fee_amount1 > 0
-            }
+            amount0_wei, amount1_wei = abi_decode(COLLECT_OUTPUT_TYPES, bytes(raw_result)[:64])
+            fee_data = self._build_fee_data(position, amount0_wei, amount1_wei)
+            self._store_fee_data(position, fee_data)
+            return fee_data
             
         except Exception as e:
             if self.debug_mode:
@@ -232,137 +763,283 @@ class BlockchainManager:
                 "error": str(e)
             }
 
+    def _build_fee_data(self, position, fee_amount0_wei, fee_amount1_wei):
+        """Convert raw collect() amounts into the fee dict used by the monitor"""
+        # Convert from wei to human-readable amounts
+        fee_amount0 = fee_amount0_wei / position["token0_info"]["wei_divisor"]
+        fee_amount1 = fee_amount1_wei / position["token1_info"]["wei_divisor"]
+        
+        if self.debug_mode:
+            print(f"🔍 Raw fees: {fee_amount0_wei} wei token0, {fee_amount1_wei} wei token1")
+            print(f"🔍 Human fees: {fee_amount0} {position['token0_symbol']}, {fee_amount1} {position['token1_symbol']}")
+        
+        return {
+            "fee_amount0": fee_amount0,
+            "fee_amount1": fee_amount1,
+            "fee_amount0_wei": fee_amount0_wei,
+            "fee_amount1_wei": fee_amount1_wei,
+            "has_fees": fee_amount0_wei > 0 or fee_amount1_wei > 0
+        }
+
+    def get_unclaimed_fees_bulk(self, positions, wallet_address):
+        """Get unclaimed fees for many positions with one batched round-trip.
+
+        Each static collect() is sent as its own eth_call with from=wallet inside a
+        JSON-RPC batch, so msg.sender stays the owner (a Multicall3 aggregate would
+        make the multicall contract the caller and collect() would revert).
+        Returns a list of fee dicts aligned with positions.
+        """
+        if not positions:
+            return []
+
+        # Quiescent positions reuse their last result; only the rest are simulated
+        fee_results = [self._get_cached_fee_data(position) for position in positions]
+        pending = [i for i, fee_data in enumerate(fee_results) if fee_data is None]
+        if not pending:
+            return fee_results
+
+        calls = [self._collect_call(positions[i], wallet_address) for i in pending]
+
+        try:
+            raw_results = self._batch_eth_call(calls)
+        except Exception as e:
+            if self.debug_mode:
+                print(f"⚠️  Batched fee lookup failed, using single calls: {e}")
+            raw_results = [None] * len(pending)
+
+        retry = []
+        for i, data in zip(pending, raw_results):
+            position = positions[i]
+            if data and len(data) >= 64:
+                amount0_wei, amount1_wei = abi_decode(COLLECT_OUTPUT_TYPES, data[:64])
+                fee_results[i] = self._build_fee_data(position, amount0_wei, amount1_wei)
+                self._store_fee_data(position, fee_results[i])
+            else:
+                retry.append(i)
+
+        if retry:
+            # Failed batch entries: retry alone (concurrently) so errors are reported per position
+            with ThreadPoolExecutor(max_workers=min(self._call_concurrency, len(retry))) as executor:
+                retried = executor.map(lambda i: self.get_unclaimed_fees(positions[i], wallet_address), retry)
+                for i, fee_data in zip(retry, retried):
+                    fee_results[i] = fee_data
+        return fee_results
+
+    def refresh_block_number(self):
+        """Fetch the latest block once for this tick; pool cache entries from older blocks go stale"""
+        try:
+            block_number = self._rl_call(lambda: self.w3.eth.block_number)
+        except Exception:
+            block_number = None
+        self._block_number_cache = (block_number, time.time())
+        return block_number
+
+    def _get_block_number(self):
+        """Latest block number, reusing the value fetched for the current tick"""
+        block_number, fetched_at = self._block_number_cache
+        if block_number is not None and (time.time() - fetched_at) <= self._pool_cache_ttl_seconds:
+            return block_number
+        # One refresh at a time; threads that waited reuse its result
+        with self._block_number_lock:
+            block_number, fetched_at = self._block_number_cache
+            if block_number is not None and (time.time() - fetched_at) <= self._pool_cache_ttl_seconds:
+                return block_number
+            return self.refresh_block_number()
+
+    def _read_sqrt_price_tick(self, pool_address, selector, block_identifier):
+        """Raw slot0()/globalState() call decoded to its leading (sqrtPriceX96, tick) words"""
+        raw = self._eth_call_raw(to_checksum(pool_address), selector, block_identifier)
+        if len(raw) < 64:
+            raise ValueError(f"short {selector.hex()} result ({len(raw)} bytes)")
+        sqrt_bytes, tick_bytes = _SQRT_PRICE_TICK_WORDS.unpack_from(raw, 0)
+        return int.from_bytes(sqrt_bytes, 'big'), int.from_bytes(tick_bytes, 'big', signed=True)
+
     def get_pool_data_flexible(self, pool_address, dex_type="uniswap_v3"):
         """Enhanced pool data getter with better Algebra parsing"""
         if not pool_address:
             return None
 
-        # Cache key
-        try:
-            block_number = self.w3.eth.block_number
-        except Exception:
-            block_number = None
+        # Cache key; reads below are pinned to this block
+        block_number = self._get_block_number()
+        block_tag = block_number if block_number is not None else "latest"
         now_ts = int(time.time())
-        cache_key = (pool_address, dex_type)
+        cache_key = (to_checksum(pool_address), dex_type)
         cached = self._pool_cache.get(cache_key)
         if cached:
             data, ts, blk = cached
-            if (now_ts - ts) <= self._pool_cache_ttl_seconds and (self._last_cache_block == blk or blk is None):
+            if block_number is not None and blk is not None:
+                if blk >= block_number:
+                    return data
+            elif (now_ts - ts) <= self._pool_cache_ttl_seconds:
                 return data
 
-        # Helper for caching
-        def _cache_and_return(result_dict):
+        # Read method that worked last time for this pool (skips the probing ladder)
+        known_method = self._pool_method.get(cache_key[0])
+
+        # Single exit for every successful read: build the result, cache it, remember the method
+        def _cache_and_return(sqrt_price_x96, current_tick, token0_address, token1_address,
+                              method, label, source, **extra):
+            token0_info = self.get_enhanced_token_info(token0_address, source)
+            token1_info = self.get_enhanced_token_info(token1_address, source)
+
+            # Calculate price with correct decimals
+            price = sqrt_price_to_price(sqrt_price_x96, token0_info["decimals"], token1_info["decimals"])
+
+            result_dict = {
+                "current_tick": current_tick,
+                "price": price,
+                "sqrt_price_x96": sqrt_price_x96,
+                "token0_decimals": token0_info["decimals"],
+                "token1_decimals": token1_info["decimals"],
+                "token0_symbol": token0_info["display_symbol"],
+                "token1_symbol": token1_info["display_symbol"],
+                **extra,
+                "method": label
+            }
             self._pool_cache[cache_key] = (result_dict, now_ts, block_number)
-            self._last_cache_block = block_number
+            if known_method != method:
+                self._pool_method[cache_key[0]] = method
+                self._schedule_token_cache_flush()
             return result_dict
 
-        # Helper: multicall token0/token1 (saves an RPC)
+        # Helper: token0/token1 (cached per pool, else multicall to save an RPC)
+        def _pool_token_addresses(pool_contract):
+            cached_tokens = self._pool_tokens.get(cache_key[0])
+            if cached_tokens:
+                return cached_tokens
+            token0_address, token1_address = _multicall_token_addresses()
+            if not token0_address or not token1_address:
+                token0_address = pool_contract.functions.token0().call()
+                token1_address = pool_contract.functions.token1().call()
+            self._pool_tokens[cache_key[0]] = (token0_address, token1_address)
+            return token0_address, token1_address
+
         def _multicall_token_addresses():
             try:
                 if not self.multicall:
                     return None, None
-                pool_min = self.w3.eth.contract(address=Web3.to_checksum_address(pool_address), abi=MINIMAL_POOL_ABI)
-                calldata_t0 = pool_min.encodeABI(fn_name='token0')
-                calldata_t1 = pool_min.encodeABI(fn_name='token1')
                 calls = [
-                    (Web3.to_checksum_address(pool_address), calldata_t0),
-                    (Web3.to_checksum_address(pool_address), calldata_t1)
+                    (cache_key[0], TOKEN0_SELECTOR),
+                    (cache_key[0], TOKEN1_SELECTOR)
                 ]
                 block_num, ret = self.multicall.functions.aggregate(calls).call()
                 # ret[0] and ret[1] are bytes; decode as address (20 bytes right padded)
-                token0_address = Web3.to_checksum_address('0x' + ret[0][-20:].hex())
-                token1_address = Web3.to_checksum_address('0x' + ret[1][-20:].hex())
+                token0_address = address_from_word(ret[0])
+                token1_address = address_from_word(ret[1])
                 return token0_address, token1_address
             except Exception:
                 return None, None
         
-        if dex_type == "algebra_integral":
-            # Try multiple Algebra versions
-            algebra_abis = [
-                ("v1", ALGEBRA_POOL_ABI_V1), 
-                ("v3", ALGEBRA_POOL_ABI_V3)
-            ]
-            
-            for version, abi in algebra_abis:
+        # Helper: cold pool probe as one permissive aggregate3 (price read(s) + token0/token1)
+        def _aggregate3_pool_read():
+            selectors = [SLOT0_SELECTOR]
+            if dex_type == "algebra_integral":
+                selectors = [GLOBAL_STATE_SELECTOR, SLOT0_SELECTOR]
+            cached_tokens = self._pool_tokens.get(cache_key[0])
+            calls = [(cache_key[0], True, selector) for selector in selectors]
+            if not cached_tokens:
+                calls.append((cache_key[0], True, TOKEN0_SELECTOR))
+                calls.append((cache_key[0], True, TOKEN1_SELECTOR))
+            try:
+                ret = self._aggregate3(calls, block_tag)
+            except Exception as e:
+                if self.debug_mode:
+                    print(f"⚠️  aggregate3 pool probe failed: {e}")
+                return None
+
+            core = None
+            for selector, (success, data_bytes) in zip(selectors, ret):
+                if not success or not data_bytes or len(data_bytes) < 64:
+                    continue
+                sqrt_bytes, tick_bytes = _SQRT_PRICE_TICK_WORDS.unpack_from(data_bytes, 0)
+                sqrt_price_x96 = int.from_bytes(sqrt_bytes, 'big')
+                current_tick = int.from_bytes(tick_bytes, 'big', signed=True)
+                if sqrt_price_x96 > 0 and abs(current_tick) < 887272:  # Valid tick range
+                    core = (selector, sqrt_price_x96, current_tick)
+                    break
+            if core is None:
+                return None
+            selector, sqrt_price_x96, current_tick = core
+
+            if cached_tokens:
+                token0_address, token1_address = cached_tokens
+            else:
+                (ok0, data0), (ok1, data1) = ret[len(selectors):]
+                if not (ok0 and ok1 and len(data0) >= 32 and len(data1) >= 32):
+                    return None
+                token0_address = address_from_word(data0)
+                token1_address = address_from_word(data1)
+                self._pool_tokens[cache_key[0]] = (token0_address, token1_address)
+
+            # Both tokens' metadata in one batch if either is missing
+            self._fetch_token_metadata_bulk([token0_address, token1_address])
+
+            is_slot0 = selector == SLOT0_SELECTOR
+            if self.debug_mode:
+                print(f"✅ aggregate3 {'slot0' if is_slot0 else 'globalState'} probe worked! Tick: {current_tick}")
+            return _cache_and_return(
+                sqrt_price_x96, current_tick, token0_address, token1_address,
+                "uniswap_v3" if is_slot0 else "v1",
+                "multicall_slot0" if is_slot0 else "multicall_globalState",
+                "Multicall"
+            )
+
+        # Unknown pool: one round-trip instead of walking the ABI ladder call by call
+        if known_method is None and self.multicall:
+            result = _aggregate3_pool_read()
+            if result is not None:
+                return result
+
+        if dex_type == "algebra_integral" and known_method != "uniswap_v3":
+            # globalState() leads with (sqrtPriceX96, tick) in every Algebra version, so read
+            # those two words raw instead of ABI-decoding the version-specific tuple
+            if known_method != "enhanced_raw":
+                version = known_method if known_method in ("v1", "v3") else "v1"
                 try:
                     if self.debug_mode:
-                        print(f"🔍 Trying Algebra {version} ABI...")
-                    
-                    pool_contract = self.w3.eth.contract(
-                        address=Web3.to_checksum_address(pool_address),
-                        abi=abi
+                        print("🔍 Trying Algebra globalState() words...")
+
+                    sqrt_price_x96, current_tick = self._read_sqrt_price_tick(
+                        pool_address, GLOBAL_STATE_SELECTOR, block_tag
                     )
-                    
-                    # Get pool data using globalState
-                    global_state = pool_contract.functions.globalState().call()
-                    
-                    if self.debug_mode:
-                        print(f"🔍 GlobalState {version}: {global_state}")
-                    
-                    # Extract tick and sqrtPriceX96 (they should be in positions 0 and 1)
-                    sqrt_price_x96 = global_state[0]
-                    current_tick = global_state[1]
-                    
+
                     # Sanity check the values
                     if sqrt_price_x96 > 0 and abs(current_tick) < 887272:  # Valid tick range
                         if self.debug_mode:
-                            print(f"✅ Algebra {version} ABI worked! Tick: {current_tick}, Price: {sqrt_price_x96}")
-                        
-                        # Get token addresses (try multicall first)
-                        token0_address, token1_address = _multicall_token_addresses()
-                        if not token0_address or not token1_address:
-                            token0_address = pool_contract.functions.token0().call()
-                            token1_address = pool_contract.functions.token1().call()
-                        
-                        # Get enhanced token info
-                        token0_info = self.get_enhanced_token_info(token0_address, "Algebra")
-                        token1_info = self.get_enhanced_token_info(token1_address, "Algebra")
-                        
-                        # Calculate price with correct decimals
-                        price = sqrt_price_to_price(sqrt_price_x96, token0_info["decimals"], token1_info["decimals"])
-                        
-                        return _cache_and_return({
-                            "current_tick": current_tick,
-                            "price": price,
-                            "sqrt_price_x96": sqrt_price_x96,
-                            "token0_decimals": token0_info["decimals"],
-                            "token1_decimals": token1_info["decimals"],
-                            "token0_symbol": token0_info["display_symbol"],
-                            "token1_symbol": token1_info["display_symbol"],
-                            "algebra_version": version,
-                            "method": f"algebra_{version}_abi"
-                        })
+                            print(f"✅ Algebra globalState() worked! Tick: {current_tick}, Price: {sqrt_price_x96}")
+
+                        # Get token addresses (cached, else multicall)
+                        token0_address, token1_address = _pool_token_addresses(
+                            self._contract(pool_address, MINIMAL_POOL_ABI)
+                        )
+
+                        return _cache_and_return(
+                            sqrt_price_x96, current_tick, token0_address, token1_address,
+                            version, f"algebra_{version}_abi", "Algebra", algebra_version=version
+                        )
                     else:
                         if self.debug_mode:
-                            print(f"⚠️  Algebra {version} returned suspicious values: tick={current_tick}, price={sqrt_price_x96}")
-                        
+                            print(f"⚠️  Algebra globalState() returned suspicious values: tick={current_tick}, price={sqrt_price_x96}")
+
                 except Exception as e:
                     if self.debug_mode:
-                        print(f"⚠️  Algebra {version} ABI failed: {e}")
-                    continue
-            
+                        print(f"⚠️  Algebra globalState() read failed: {e}")
+
             # If all Algebra versions failed, try raw call approach with enhanced parsing
             try:
                 if self.debug_mode:
                     print("🔍 Trying enhanced raw globalState() call...")
                 
                 # Get basic token info first
-                pool_contract = self.w3.eth.contract(
-                    address=Web3.to_checksum_address(pool_address),
-                    abi=MINIMAL_POOL_ABI
-                )
+                pool_contract = self._contract(pool_address, MINIMAL_POOL_ABI)
                 
-                token0_address, token1_address = _multicall_token_addresses()
-                if not token0_address or not token1_address:
-                    token0_address = pool_contract.functions.token0().call()
-                    token1_address = pool_contract.functions.token1().call()
+                token0_address, token1_address = _pool_token_addresses(pool_contract)
                 
                 # Try raw call to globalState
-                function_selector = self.w3.keccak(text="globalState()")[:4]
-                raw_result = self.w3.eth.call({
-                    'to': pool_address,
-                    'data': '0x' + function_selector.hex()
-                })
+                raw_result = self._rl_call(self.w3.eth.call, {
+                    'to': cache_key[0],
+                    'data': '0x' + GLOBAL_STATE_SELECTOR.hex()
+                }, block_tag)
                 
                 sqrt_price_x96, current_tick = parse_algebra_raw_data(raw_result, self.debug_mode)
                 
@@ -370,24 +1047,10 @@ class BlockchainManager:
                     if self.debug_mode:
                         print(f"✅ Enhanced raw parsing worked! Tick: {current_tick}, Price: {sqrt_price_x96}")
                     
-                    # Get enhanced token info
-                    token0_info = self.get_enhanced_token_info(token0_address, "Algebra Raw")
-                    token1_info = self.get_enhanced_token_info(token1_address, "Algebra Raw")
-                    
-                    # Calculate price with correct decimals
-                    price = sqrt_price_to_price(sqrt_price_x96, token0_info["decimals"], token1_info["decimals"])
-                    
-                    return _cache_and_return({
-                        "current_tick": current_tick,
-                        "price": price,
-                        "sqrt_price_x96": sqrt_price_x96,
-                        "token0_decimals": token0_info["decimals"],
-                        "token1_decimals": token1_info["decimals"],
-                        "token0_symbol": token0_info["display_symbol"],
-                        "token1_symbol": token1_info["display_symbol"],
-                        "algebra_version": "enhanced_raw",
-                        "method": "enhanced_raw_parsing"
-                    })
+                    return _cache_and_return(
+                        sqrt_price_x96, current_tick, token0_address, token1_address,
+                        "enhanced_raw", "enhanced_raw_parsing", "Algebra Raw", algebra_version="enhanced_raw"
+                    )
                     
             except Exception as e:
                 if self.debug_mode:
@@ -398,45 +1061,24 @@ class BlockchainManager:
             if self.debug_mode:
                 print("🔄 Falling back to Uniswap V3 method...")
             
-            pool_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(pool_address),
-                abi=POOL_ABI
-            )
-            
-            slot0 = pool_contract.functions.slot0().call()
-            current_tick = slot0[1]
-            sqrt_price_x96 = slot0[0]
-            
-            token0_address, token1_address = _multicall_token_addresses()
-            if not token0_address or not token1_address:
-                token0_address = pool_contract.functions.token0().call()
-                token1_address = pool_contract.functions.token1().call()
-            
-            # Get enhanced token info
-            token0_info = self.get_enhanced_token_info(token0_address, "Uniswap V3")
-            token1_info = self.get_enhanced_token_info(token1_address, "Uniswap V3")
+            # slot0() leads with (sqrtPriceX96, tick); only those two words are used
+            sqrt_price_x96, current_tick = self._read_sqrt_price_tick(pool_address, SLOT0_SELECTOR, block_tag)
             
-            # Calculate price with correct decimals
-            price = sqrt_price_to_price(sqrt_price_x96, token0_info["decimals"], token1_info["decimals"])
+            token0_address, token1_address = _pool_token_addresses(self._contract(pool_address, MINIMAL_POOL_ABI))
             
-            return _cache_and_return({
-                "current_tick": current_tick,
-                "price": price,
-                "sqrt_price_x96": sqrt_price_x96,
-                "token0_decimals": token0_info["decimals"],
-                "token1_decimals": token1_info["decimals"],
-                "token0_symbol": token0_info["display_symbol"],
-                "token1_symbol": token1_info["display_symbol"],
-                "method": "uniswap_v3"
-            })
+            return _cache_and_return(
+                sqrt_price_x96, current_tick, token0_address, token1_address,
+                "uniswap_v3", "uniswap_v3", "Uniswap V3"
+            )
             
         except Exception as e:
+            if known_method is not None:
+                # Remembered method stopped working; forget it and probe the full ladder
+                self._pool_method.pop(cache_key[0], None)
+                return self.get_pool_data_flexible(pool_address, dex_type)
             print(f"⚠️  All methods failed for pool {pool_address}: {e}")
             return None
 
-        # Store in cache before returning (when successful paths return)
-        # Note: earlier returns bypass this; refactor by capturing 'result' then caching once.
-
     def prefetch_pool_data(self, pool_entries):
         """Prefetch pool tick/price and token metadata for a set of unique pools.
 
@@ -456,7 +1098,7 @@ class BlockchainManager:
                 addr, dtype = entry
             if not addr:
                 continue
-            key = (Web3.to_checksum_address(addr), dtype)
+            key = (to_checksum(addr), dtype)
             if key in seen:
                 continue
             seen.add(key)
@@ -465,94 +1107,119 @@ class BlockchainManager:
         if not normalized:
             return
 
-        # Build calls for slot0/globalState
-        slot0_selector = self.w3.keccak(text="slot0()")[:4]
-        global_selector = self.w3.keccak(text="globalState()")[:4]
-        calls = []
-        call_index = []  # map index -> (pool, dtype)
+        # One permissive aggregate3 per tick: block number, slot0/globalState for
+        # every pool, token0/token1 for pools not seen before, and decimals/symbol/name
+        # for tokens of known pools that aren't cached yet. Failed entries come
+        # back as success=False instead of reverting the whole batch.
+        calls = [(MULTICALL3_ADDRESS, True, GET_BLOCK_NUMBER_SELECTOR)]
+        call_index = [("block", None)]
+        metadata_tokens = []
         for addr, dtype in normalized:
-            selector = slot0_selector if dtype == 'uniswap_v3' else global_selector
-            # Pass bytes selector directly for no-arg calls
-            calls.append((addr, selector))
-            call_index.append((addr, dtype))
+            selector = SLOT0_SELECTOR if dtype == 'uniswap_v3' else GLOBAL_STATE_SELECTOR
+            calls.append((addr, True, selector))
+            call_index.append(("core", (addr, dtype)))
+            if addr in self._pool_tokens:
+                for token_address in self._pool_tokens[addr]:
+                    token_address = to_checksum(token_address)
+                    if (token_address not in self._static_tokens and token_address not in metadata_tokens
+                            and self._get_cached_token(token_address) is None):
+                        metadata_tokens.append(token_address)
+            else:
+                calls.append((addr, True, TOKEN0_SELECTOR))
+                call_index.append(("token", (addr, 0)))
+                calls.append((addr, True, TOKEN1_SELECTOR))
+                call_index.append(("token", (addr, 1)))
+        for token_address in metadata_tokens:
+            for selector in (DECIMALS_SELECTOR, SYMBOL_SELECTOR, NAME_SELECTOR):
+                calls.append((token_address, True, selector))
+                call_index.append(("meta", token_address))
 
         try:
-            block_num, ret_datas = self._rl_call(self.multicall.functions.aggregate(calls).call)
+            ret = self._aggregate3(calls, self._block_tag())
         except Exception:
-            return  # silently skip if multicall fails
+            return  # silently skip if multicall is unavailable
 
         # Decode helpers
-        def decode_slot0(data_bytes):
-            # Expect at least 2 words
+        def decode_core(data_bytes):
+            # slot0() and globalState() both lead with (sqrtPriceX96, tick)
             if not data_bytes or len(data_bytes) < 64:
                 return None, None
-            sqrt_price = int.from_bytes(data_bytes[0:32], 'big')
-            tick_raw = int.from_bytes(data_bytes[32:64], 'big', signed=True)
-            return sqrt_price, tick_raw
+            sqrt_bytes, tick_bytes = _SQRT_PRICE_TICK_WORDS.unpack_from(data_bytes, 0)
+            return int.from_bytes(sqrt_bytes, 'big'), int.from_bytes(tick_bytes, 'big', signed=True)
 
-        def decode_global_state(data_bytes):
-            if not data_bytes or len(data_bytes) < 64:
-                return None, None
-            sqrt_price = int.from_bytes(data_bytes[0:32], 'big')
-            tick_raw = int.from_bytes(data_bytes[32:64], 'big', signed=True)
-            return sqrt_price, tick_raw
-
-        # First pass: decode ticks and sqrt prices
+        block_num = None
         pool_to_core = {}
-        for i, (addr, dtype) in enumerate(call_index):
-            data_bytes = ret_datas[i]
-            sqrt_p, tick = (decode_slot0(data_bytes) if dtype == 'uniswap_v3' else decode_global_state(data_bytes))
-            if sqrt_p is None or tick is None:
-                continue
-            pool_to_core[(addr, dtype)] = (sqrt_p, tick)
+        token_map = {}
+        metadata_results = {}
+        for (kind, key), (success, data_bytes) in zip(call_index, ret):
+            if not success or not data_bytes:
+                data_bytes = None
+            if kind == "block":
+                if data_bytes and len(data_bytes) >= 32:
+                    block_num = int.from_bytes(data_bytes[:32], 'big')
+            elif kind == "core":
+                sqrt_p, tick = decode_core(data_bytes)
+                if sqrt_p is not None and tick is not None:
+                    pool_to_core[key] = (sqrt_p, tick)
+            elif kind == "token":
+                if data_bytes and len(data_bytes) >= 32:
+                    addr, which = key
+                    token_map.setdefault(addr, [None, None])[which] = address_from_word(data_bytes)
+            else:
+                metadata_results.setdefault(key, []).append(data_bytes)
+
+        if block_num is None:
+            block_num = self._get_block_number()
+        else:
+            # The aggregate's block is the freshest we know of; use it for this tick
+            self._block_number_cache = (block_num, time.time())
+
+        for token_address, results in metadata_results.items():
+            token_info = self._parse_token_metadata(token_address, *results)
+            if token_info is not None:
+                self._set_cached_token(token_address, token_info)
 
         if not pool_to_core:
             return
 
-        # Batch token0/token1 for all pools
-        try:
-            pool_min = self.w3.eth.contract(abi=MINIMAL_POOL_ABI, address=Web3.to_checksum_address(list(pool_to_core.keys())[0][0]))
-        except Exception:
-            pool_min = None
-
-        t_calls = []
-        index_list = []
-        for addr, dtype in pool_to_core.keys():
-            if pool_min:
-                # Build ABI per pool for correctness
-                pool_c = self.w3.eth.contract(address=addr, abi=MINIMAL_POOL_ABI)
-                t0 = pool_c.encodeABI(fn_name='token0')
-                t1 = pool_c.encodeABI(fn_name='token1')
-                t_calls.append((addr, bytes.fromhex(t0[2:])))
-                t_calls.append((addr, bytes.fromhex(t1[2:])))
-                index_list.append((addr, 0))
-                index_list.append((addr, 1))
-            else:
-                # Fallback to direct calls later
-                pass
-
-        token_map = {}
-        if t_calls:
+        # Pools whose token0/token1 entries failed inside the aggregate: retry them together
+        missing = [addr for addr, _ in pool_to_core
+                   if addr not in self._pool_tokens and not all(token_map.get(addr, ()))]
+        if missing:
             try:
-                _, t_rets = self._rl_call(self.multicall.functions.aggregate(t_calls).call)
-                for j, (addr, which) in enumerate(index_list):
-                    data = t_rets[j]
-                    if data and len(data) >= 32:
-                        token_addr = Web3.to_checksum_address('0x' + data[-20:].hex())
-                        token_map.setdefault(addr, [None, None])[which] = token_addr
-            except Exception:
-                token_map = {}
+                t_rets = self._batch_eth_call(
+                    [(addr, selector) for addr in missing for selector in (TOKEN0_SELECTOR, TOKEN1_SELECTOR)],
+                    block_identifier=block_num
+                )
+                for n, addr in enumerate(missing):
+                    data0, data1 = t_rets[2 * n], t_rets[2 * n + 1]
+                    if data0 and data1 and len(data0) >= 32 and len(data1) >= 32:
+                        token_map[addr] = [address_from_word(data0), address_from_word(data1)]
+            except Exception as e:
+                if self.debug_mode:
+                    print(f"⚠️  Batched token0/token1 retry failed: {e}")
+
+        # Metadata for every token still missing from the cache, deduplicated across
+        # pools, in one batched round-trip (cached tokens are skipped by the bulk fetch)
+        pool_tokens = [
+            self._pool_tokens.get(addr) or token_map.get(addr) or (None, None)
+            for addr, _ in pool_to_core
+        ]
+        self._fetch_token_metadata_bulk(t for pair in pool_tokens if all(pair) for t in pair)
 
         # Build cache entries
         for (addr, dtype), (sqrt_p, tick) in pool_to_core.items():
             try:
                 # Resolve token addresses (fallback to direct call if needed)
-                if addr in token_map:
+                if addr in self._pool_tokens:
+                    token0_address, token1_address = self._pool_tokens[addr]
+                elif addr in token_map and all(token_map[addr]):
                     token0_address, token1_address = token_map[addr]
                 else:
-                    pool_c = self.w3.eth.contract(address=addr, abi=MINIMAL_POOL_ABI)
+                    pool_c = self._contract(addr, MINIMAL_POOL_ABI)
                     token0_address = pool_c.functions.token0().call()
                     token1_address = pool_c.functions.token1().call()
+                self._pool_tokens[addr] = (token0_address, token1_address)
 
                 # Token metadata
                 token0_info = self.get_enhanced_token_info(token0_address, "Prefetch")
@@ -572,8 +1239,7 @@ class BlockchainManager:
                     "token1_symbol": token1_info["display_symbol"],
                     "method": "multicall_slot0" if dtype == 'uniswap_v3' else "multicall_globalState"
                 }
-                self._pool_cache[(addr, dtype)] = (result, int(time.time()), self.w3.eth.block_number)
-                self._last_cache_block = self.w3.eth.block_number
+                self._pool_cache[(addr, dtype)] = (result, int(time.time()), block_num)
             except Exception:
                 continue
 
@@ -581,61 +1247,64 @@ class BlockchainManager:
         """Auto-detect DEX type based on available methods"""
         if not factory_address:
             return "uniswap_v3"
-        
+
+        factory_address = to_checksum(factory_address)
+        if factory_address in self._factory_type_cache:
+            return self._factory_type_cache[factory_address]
+
+        # Algebra factories expose poolByPair(address,address); look for its selector in the bytecode
+        is_algebra = False
         try:
-            # Try Algebra factory first
-            factory_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(factory_address),
-                abi=ALGEBRA_FACTORY_ABI
-            )
-            
-            # Test if poolByPair method exists (Algebra signature)
-            try:
-                # This will fail if not Algebra
-                test_call = factory_contract.functions.poolByPair
-                if self.debug_mode:
-                    print(f"Auto-detected: {dex_name} uses Algebra Integral")
-                return "algebra_integral"
-            except:
-                pass
-        except:
+            code = bytes(self._rl_call(self.w3.eth.get_code, factory_address))
+            is_algebra = POOL_BY_PAIR_SELECTOR in code
+            if code and not is_algebra:
+                # Not in the bytecode (e.g. a proxy): probe it; a revert means not Algebra
+                calldata = POOL_BY_PAIR_SELECTOR + bytes(64)
+                result = self._rl_call(self.w3.eth.call, {'to': factory_address, 'data': '0x' + calldata.hex()})
+                is_algebra = len(result) >= 32
+        except Exception:
             pass
-        
-        # Default to Uniswap V3
+
+        dex_type = "algebra_integral" if is_algebra else "uniswap_v3"
+        self._factory_type_cache[factory_address] = dex_type
         if self.debug_mode:
-            print(f"Auto-detected: {dex_name} uses Uniswap V3")
-        return "uniswap_v3"
+            print(f"Auto-detected: {dex_name} uses {'Algebra Integral' if is_algebra else 'Uniswap V3'}")
+        return dex_type
 
     def get_pool_address(self, token0, token1, fee, factory_address, dex_type="uniswap_v3"):
         """Get pool address from factory with support for different DEX types"""
         if not factory_address:
             print("⚠️  No factory address available")
             return None
-        
+
+        # Pool addresses never change; "no pool" answers are kept for a while
+        cache_key = (to_checksum(factory_address), to_checksum(token0), to_checksum(token1), fee, dex_type)
+        cached = self._pool_address_cache.get(cache_key)
+        if cached is not None:
+            pool_address, expires_at = cached
+            if expires_at is None or time.time() < expires_at:
+                return pool_address
+
         try:
             if dex_type == "algebra_integral":
                 # Algebra Integral uses poolByPair instead of getPool
-                factory_contract = self.w3.eth.contract(
-                    address=Web3.to_checksum_address(factory_address),
-                    abi=ALGEBRA_FACTORY_ABI
-                )
+                factory_contract = self._contract(factory_address, ALGEBRA_FACTORY_ABI)
                 
                 # Algebra doesn't use fee parameter in pool lookup
                 pool_address = factory_contract.functions.poolByPair(token0, token1).call()
                 
             else:
                 # Standard Uniswap V3 approach
-                factory_contract = self.w3.eth.contract(
-                    address=Web3.to_checksum_address(factory_address),
-                    abi=FACTORY_ABI
-                )
+                factory_contract = self._contract(factory_address, FACTORY_ABI)
                 
                 pool_address = factory_contract.functions.getPool(token0, token1, fee).call()
             
             if pool_address == "0x0000000000000000000000000000000000000000":
                 print(f"No pool found for tokens {token0[:6]}.../{token1[:6]}... (type: {dex_type})")
+                self._pool_address_cache[cache_key] = (None, time.time() + self._pool_not_found_ttl_seconds)
                 return None
-                
+
+            self._pool_address_cache[cache_key] = (pool_address, None)
             return pool_address
             
         except Exception as e:
@@ -647,6 +1316,87 @@ class BlockchainManager:
                 return self.get_pool_address(token0, token1, fee, factory_address, "uniswap_v3")
             return None
 
+    def get_pool_addresses_bulk(self, pool_keys, factory_address, dex_type="uniswap_v3"):
+        """Pool address per (token0, token1, fee) key; uncached keys are resolved in one JSON-RPC batch.
+        Keys the batch could not answer go through get_pool_address and its Algebra -> V3 fallback."""
+        resolved = {}
+        pending = []
+        if factory_address:
+            factory_cs = to_checksum(factory_address)
+            now = time.time()
+            for key in pool_keys:
+                cached = self._pool_address_cache.get(
+                    (factory_cs, to_checksum(key[0]), to_checksum(key[1]), key[2], dex_type)
+                )
+                if cached is not None and (cached[1] is None or now < cached[1]):
+                    resolved[key] = cached[0]
+                else:
+                    pending.append(key)
+        else:
+            pending = list(pool_keys)
+
+        if pending and factory_address:
+            if dex_type == "algebra_integral":
+                calls = [(factory_cs, POOL_BY_PAIR_SELECTOR + address_to_word(token0) + address_to_word(token1))
+                         for token0, token1, _ in pending]
+            else:
+                calls = [(factory_cs, GET_POOL_SELECTOR + address_to_word(token0) + address_to_word(token1)
+                          + int(fee).to_bytes(32, 'big'))
+                         for token0, token1, fee in pending]
+            try:
+                results = self._batch_eth_call(calls)
+            except Exception as e:
+                if self.debug_mode:
+                    print(f"⚠️  Batch pool lookup failed, using single calls: {e}")
+                results = [None] * len(pending)
+
+            unresolved = []
+            for key, data in zip(pending, results):
+                if data is None or len(data) < 32:
+                    unresolved.append(key)
+                    continue
+                cache_key = (factory_cs, to_checksum(key[0]), to_checksum(key[1]), key[2], dex_type)
+                if not any(data[12:32]):
+                    print(f"No pool found for tokens {key[0][:6]}.../{key[1][:6]}... (type: {dex_type})")
+                    self._pool_address_cache[cache_key] = (None, time.time() + self._pool_not_found_ttl_seconds)
+                    resolved[key] = None
+                else:
+                    pool_address = address_from_word(data)
+                    self._pool_address_cache[cache_key] = (pool_address, None)
+                    resolved[key] = pool_address
+            pending = unresolved
+
+        for key in pending:
+            resolved[key] = self.get_pool_address(*key, factory_address, dex_type)
+        return resolved
+
+    def _apply_transfer_logs(self, wallet_cs, position_manager_address, logs_transfer, from_block, to_block):
+        """Roll tracked holdings forward with Transfer logs covering [from_block, to_block].
+        Tracking is dropped if the logs do not continue from where it left off.
+        """
+        owner_key = (wallet_cs, to_checksum(position_manager_address))
+        held = self._owned_token_ids.get(owner_key)
+        if not held:
+            return
+        if from_block > held["block"] + 1:
+            # Gap in coverage; re-seed from the next full enumeration
+            self._owned_token_ids.pop(owner_key, None)
+            return
+
+        ids = held["ids"]
+        wallet_word = address_to_word(wallet_cs)
+        ordered = sorted(logs_transfer or [], key=lambda lg: (lg.get('blockNumber', 0), lg.get('logIndex', 0)))
+        for lg in ordered:
+            topics = lg.get('topics')
+            if not topics or len(topics) < 4:
+                continue
+            token_id = int.from_bytes(bytes(topics[3]), 'big')
+            if bytes(topics[1]) == wallet_word:
+                ids.discard(token_id)
+            if bytes(topics[2]) == wallet_word:
+                ids.add(token_id)
+        held["block"] = to_block
+
     def fetch_positions_from_dex(self, wallet_address, dex_config, suppress_output=False, force_full=False):
         """Fetch LP positions from a specific DEX with fee tracking"""
         dex_name = dex_config["name"]
@@ -659,16 +1409,15 @@ class BlockchainManager:
             print(f"\nChecking {dex_name} ({dex_type})...")
         
         try:
-            self._throttle_rpc()
-            position_manager = self.w3.eth.contract(
-                address=Web3.to_checksum_address(position_manager_address),
-                abi=POSITION_MANAGER_ABI
-            )
-            
-            # Get factory address from position manager
+            # Get factory address from position manager (immutable, so read once per manager)
             factory_address = None
             try:
-                factory_address = position_manager.functions.factory().call()
+                pm_key = to_checksum(position_manager_address)
+                factory_address = self._factory_by_position_manager.get(pm_key)
+                if factory_address is None:
+                    position_manager = self._contract(pm_key, POSITION_MANAGER_ABI)
+                    factory_address = self._rl_call(position_manager.functions.factory().call)
+                    self._factory_by_position_manager[pm_key] = factory_address
                 if self.debug_mode and not suppress_output:
                     print(f"Factory: {factory_address}")
                 
@@ -683,51 +1432,72 @@ class BlockchainManager:
                 print(f"⚠️  Could not get factory address from {dex_name} position manager: {e}")
             
             # Event-driven refresh: try to detect changes since last scan
-            latest_block = int(self._rl_call(lambda: self.w3.eth.block_number))
-            start_block = self._last_event_block_by_dex.get(dex_name, max(latest_block - 2400, 0))  # ~5-10 min window
+            latest_block = self._get_block_number()
+            if latest_block is None:
+                raise ValueError("could not fetch the latest block number")
+            last_event_block = self._last_event_block_by_dex.get(dex_name)
+            if last_event_block is None or force_full:
+                start_block = max(latest_block - 2400, 0)  # ~5-10 min window
+            else:
+                # Tail from the cursor, re-reading a few blocks in case of a shallow reorg
+                start_block = max(last_event_block - EVENT_REORG_OVERLAP_BLOCKS, 0)
 
             changes_detected = False
             logs_ok = True
             try:
-                logs_transfer = self._rl_call(self.w3.eth.get_logs, {
-                    'fromBlock': start_block,
-                    'toBlock': latest_block,
-                    'address': Web3.to_checksum_address(position_manager_address),
-                    'topics': [self._topic_transfer, None, None]
-                })
-                logs_liq_inc = self._rl_call(self.w3.eth.get_logs, {
-                    'fromBlock': start_block,
-                    'toBlock': latest_block,
-                    'address': Web3.to_checksum_address(position_manager_address),
-                    'topics': [self._topic_increase]
-                })
-                logs_liq_dec = self._rl_call(self.w3.eth.get_logs, {
-                    'fromBlock': start_block,
-                    'toBlock': latest_block,
-                    'address': Web3.to_checksum_address(position_manager_address),
-                    'topics': [self._topic_decrease]
-                })
+                # One get_logs for all three events (topic0 OR-filter), split locally
+                logs_all = self._get_logs_chunked({
+                    'address': to_checksum(position_manager_address),
+                    'topics': [[TRANSFER_TOPIC, INCREASE_LIQUIDITY_TOPIC, DECREASE_LIQUIDITY_TOPIC]]
+                }, start_block, latest_block)
+                logs_transfer = []
+                logs_liq_inc = []
+                logs_liq_dec = []
+                for lg in (logs_all or []):
+                    if not lg.get('topics'):
+                        continue
+                    topic0 = Web3.to_hex(lg['topics'][0])
+                    if topic0 == TRANSFER_TOPIC:
+                        logs_transfer.append(lg)
+                    elif topic0 == INCREASE_LIQUIDITY_TOPIC:
+                        logs_liq_inc.append(lg)
+                    elif topic0 == DECREASE_LIQUIDITY_TOPIC:
+                        logs_liq_dec.append(lg)
                 changes_detected = bool(logs_transfer or logs_liq_inc or logs_liq_dec)
 
                 # Build event hints for this DEX
                 removed_ids = set()
                 added_ids = set()
-                wallet_cs = Web3.to_checksum_address(wallet_address)
+                wallet_cs = to_checksum(wallet_address)
+                self._apply_transfer_logs(wallet_cs, position_manager_address, logs_transfer, start_block, latest_block)
+                # Compare raw topic bytes; no per-log address checksumming
+                wallet_word = address_to_word(wallet_cs)
                 for lg in (logs_transfer or []):
-                    if not lg.get('topics') or len(lg['topics']) < 4:
+                    topics = lg.get('topics')
+                    if not topics or len(topics) < 4:
                         continue
-                    from_addr = Web3.to_checksum_address('0x' + lg['topics'][1].hex()[-40:])
-                    to_addr = Web3.to_checksum_address('0x' + lg['topics'][2].hex()[-40:])
-                    token_id = int(lg['topics'][3].hex(), 16)
-                    if from_addr == wallet_cs and to_addr != wallet_cs:
+                    from_wallet = bytes(topics[1]) == wallet_word
+                    to_wallet = bytes(topics[2]) == wallet_word
+                    token_id = int.from_bytes(bytes(topics[3]), 'big')
+                    if from_wallet and not to_wallet:
                         removed_ids.add(token_id)
-                    if to_addr == wallet_cs and from_addr != wallet_cs:
+                    if to_wallet and not from_wallet:
                         added_ids.add(token_id)
                 self._last_event_hints_by_dex[dex_name] = {
                     'removed_ids': removed_ids,
                     'added_ids': added_ids,
                     'block': latest_block
                 }
+
+                # A position manager logs every user's positions; when this wallet's holdings are
+                # tracked, only its own transfers and liquidity changes count as changes
+                held = self._owned_token_ids.get((wallet_cs, to_checksum(position_manager_address)))
+                if held is not None:
+                    own_ids = held["ids"] | removed_ids
+                    changes_detected = bool(removed_ids or added_ids) or any(
+                        int.from_bytes(bytes(lg['topics'][1]), 'big') in own_ids
+                        for lg in logs_liq_inc + logs_liq_dec if len(lg['topics']) > 1
+                    )
             except Exception:
                 logs_ok = False
 
@@ -741,7 +1511,11 @@ class BlockchainManager:
                 return None
 
             # Get number of positions owned by wallet (heavy scan)
-            balance = self._rl_call(position_manager.functions.balanceOf(wallet_address).call)
+            wallet_word = address_to_word(to_checksum(wallet_address))
+            raw_balance = self._eth_call_raw(
+                to_checksum(position_manager_address), BALANCE_OF_SELECTOR + wallet_word, "latest"
+            )
+            balance = abi_decode(("uint256",), raw_balance)[0]
             if not suppress_output:
                 print(f"Found {balance} LP NFT(s) in {dex_name}")
             
@@ -767,6 +1541,62 @@ class BlockchainManager:
                         time.sleep(0.4 * (2 ** attempt))
                 raise last_exc
             
+            # Batch tokenOfOwnerByIndex + positions over JSON-RPC batches
+            pm_checksum = to_checksum(position_manager_address)
+            wallet_cs = to_checksum(wallet_address)
+            owner_key = (wallet_cs, pm_checksum)
+            token_ids = [None] * balance
+
+            # Holdings tracked from Transfer logs skip the on-chain enumeration entirely
+            held = self._owned_token_ids.get(owner_key)
+            if held and held["block"] == latest_block and len(held["ids"]) == balance:
+                token_ids = sorted(held["ids"])
+                if self.debug_mode and not suppress_output:
+                    print(f"🔍 Using {balance} token IDs tracked from Transfer logs for {dex_name}")
+            else:
+                try:
+                    id_results = self._batch_eth_call([
+                        (pm_checksum, TOKEN_OF_OWNER_BY_INDEX_SELECTOR + wallet_word + i.to_bytes(32, 'big'))
+                        for i in range(balance)
+                    ])
+                    for i, data in enumerate(id_results):
+                        if data and len(data) >= 32:
+                            token_ids[i] = int.from_bytes(data[:32], 'big')
+                except Exception as e:
+                    if self.debug_mode and not suppress_output:
+                        print(f"⚠️  Batch tokenOfOwnerByIndex failed for {dex_name}, using single calls: {e}")
+
+            positions_by_index = [None] * balance
+            batch_indices = [i for i in range(balance) if token_ids[i] is not None]
+            try:
+                pos_results = self._batch_eth_call([
+                    (pm_checksum, POSITIONS_SELECTOR + token_ids[i].to_bytes(32, 'big'))
+                    for i in batch_indices
+                ])
+                for i, data in zip(batch_indices, pos_results):
+                    if data and len(data) >= 12 * 32:
+                        positions_by_index[i] = self._decode_positions(data)
+            except Exception as e:
+                if self.debug_mode and not suppress_output:
+                    print(f"⚠️  Batch positions() failed for {dex_name}, using single calls: {e}")
+
+            # Warm the token cache for every liquid position in one batch
+            self._fetch_token_metadata_bulk(
+                addr
+                for data in positions_by_index if data is not None and data[7] > 0
+                for addr in (data[2], data[3])
+            )
+
+            # Resolve pool addresses for liquid positions in one batch, one factory call per pool
+            pool_keys = list(dict.fromkeys(
+                (data[2], data[3], data[4])
+                for data in positions_by_index if data is not None and data[7] > 0
+            ))
+            pool_addresses = self.get_pool_addresses_bulk(pool_keys, factory_address, dex_type) if pool_keys else {}
+
+            # Token info per address for this scan; LP positions mostly share a few tokens
+            scan_token_info = {}
+
             # Get each position
             for i in range(balance):
                 try:
@@ -775,23 +1605,35 @@ class BlockchainManager:
                         if not suppress_output:
                             print(f"Progress: {i + 1}/{balance} positions scanned...")
                     
-                    # Get token ID
-                    try:
-                        token_id = _retry_call(lambda: self._rl_call(position_manager.functions.tokenOfOwnerByIndex(wallet_address, i).call))
-                    except Exception as e:
-                        had_errors = True
-                        if not suppress_output:
-                            print(f"Error fetching {dex_name} position index {i}: {e}")
-                        continue
+                    # Get token ID (fall back to a single call if the batch missed it)
+                    token_id = token_ids[i]
+                    if token_id is None:
+                        try:
+                            raw = _retry_call(
+                                self._eth_call_raw, pm_checksum,
+                                TOKEN_OF_OWNER_BY_INDEX_SELECTOR + wallet_word + i.to_bytes(32, 'big'), "latest"
+                            )
+                            token_id = abi_decode(("uint256",), raw)[0]
+                        except Exception as e:
+                            had_errors = True
+                            if not suppress_output:
+                                print(f"Error fetching {dex_name} position index {i}: {e}")
+                            continue
+                        token_ids[i] = token_id
                     
-                    # Get position details (single RPC call)
-                    try:
-                        position_data = _retry_call(lambda: self._rl_call(position_manager.functions.positions(token_id).call))
-                    except Exception as e:
-                        had_errors = True
-                        if not suppress_output:
-                            print(f"Error fetching {dex_name} position {i}: {e}")
-                        continue
+                    # Get position details (single RPC call if the batch missed it)
+                    position_data = positions_by_index[i]
+                    if position_data is None:
+                        try:
+                            raw = _retry_call(
+                                self._eth_call_raw, pm_checksum, POSITIONS_SELECTOR + token_id.to_bytes(32, 'big'), "latest"
+                            )
+                            position_data = self._decode_positions(raw)
+                        except Exception as e:
+                            had_errors = True
+                            if not suppress_output:
+                                print(f"Error fetching {dex_name} position {i}: {e}")
+                            continue
                     
                     # Extract basic info
                     liquidity = position_data[7]
@@ -811,12 +1653,20 @@ class BlockchainManager:
                     tick_lower = position_data[5]
                     tick_upper = position_data[6]
                     
-                    # Get enhanced token info
-                    token0_info = self.get_enhanced_token_info(token0_address, dex_name)
-                    token1_info = self.get_enhanced_token_info(token1_address, dex_name)
+                    # Get enhanced token info (once per distinct token in this scan)
+                    token0_info = scan_token_info.get(token0_address)
+                    if token0_info is None:
+                        token0_info = scan_token_info[token0_address] = self.get_enhanced_token_info(token0_address, dex_name)
+                    token1_info = scan_token_info.get(token1_address)
+                    if token1_info is None:
+                        token1_info = scan_token_info[token1_address] = self.get_enhanced_token_info(token1_address, dex_name)
                     
                     # Get pool address with proper DEX type
-                    pool_address = self.get_pool_address(token0_address, token1_address, fee, factory_address, dex_type)
+                    pool_key = (token0_address, token1_address, fee)
+                    if pool_key in pool_addresses:
+                        pool_address = pool_addresses[pool_key]
+                    else:
+                        pool_address = self.get_pool_address(token0_address, token1_address, fee, factory_address, dex_type)
                     
                     # Create position object with fee tracking capability
                     position = {
@@ -824,7 +1674,7 @@ class BlockchainManager:
                         "name": f"{token0_info['display_symbol']}/{token1_info['display_symbol']} Pool",
                         "dex_name": dex_name,
                         "dex_type": dex_type,
-                        "position_manager": position_manager_address,
+                        "position_manager": pm_checksum,
                         "factory_address": factory_address,
                         "token0_address": token0_address,
                         "token1_address": token1_address,
@@ -850,6 +1700,10 @@ class BlockchainManager:
                         import traceback
                         traceback.print_exc()
             
+            # Seed Transfer-log tracking from a complete enumeration
+            if logs_ok and not had_errors and all(t is not None for t in token_ids):
+                self._owned_token_ids[owner_key] = {"ids": set(token_ids), "block": latest_block}
+
             # Record scan status for this dex
             self._last_scan_status_by_dex[dex_name] = {
                 'expected': int(balance),
@@ -885,26 +1739,99 @@ class BlockchainManager:
     def get_last_event_hints(self, dex_name):
         return self._last_event_hints_by_dex.get(dex_name, {'removed_ids': set(), 'added_ids': set()})
 
+    @staticmethod
+    def _liquidity_from_positions(data):
+        """liquidity (word 7) of a raw positions() result, or None if the result is short"""
+        if not data or len(data) < 12 * 32:
+            return None
+        return int.from_bytes(data[7 * 32:8 * 32], 'big')
+
     def get_live_liquidity(self, position):
         """Get current on-chain liquidity for a position"""
         try:
-            position_manager = self.w3.eth.contract(
-                address=Web3.to_checksum_address(position["position_manager"]),
-                abi=POSITION_MANAGER_ABI
+            raw = self._eth_call_raw(
+                to_checksum(position["position_manager"]),
+                POSITIONS_SELECTOR + int(position["token_id"]).to_bytes(32, 'big')
             )
-            
-            position_data = position_manager.functions.positions(position["token_id"]).call()
-            return position_data[7]  # liquidity
-            
+            liquidity = self._liquidity_from_positions(raw)
+            if liquidity is None:
+                raise ValueError(f"short positions() result ({len(raw)} bytes)")
+            return liquidity
+
         except Exception as e:
             print(f"⚠️  Error checking live liquidity for {position['name']}: {e}")
             return position["liquidity"]  # Fallback to cached value
 
+    def get_live_liquidity_bulk(self, positions):
+        """Get current on-chain liquidity for many positions with one batched positions() round-trip.
+        Returns a list aligned with positions; entries that fail keep the cached value.
+        """
+        if not positions:
+            return []
+        try:
+            results = self._batch_eth_call([
+                (position["position_manager"], POSITIONS_SELECTOR + int(position["token_id"]).to_bytes(32, 'big'))
+                for position in positions
+            ])
+        except Exception as e:
+            if self.debug_mode:
+                print(f"⚠️  Batched liquidity check failed, using single calls: {e}")
+            return [self.get_live_liquidity(position) for position in positions]
+
+        liquidities = []
+        for position, data in zip(positions, results):
+            liquidity = self._liquidity_from_positions(data)
+            liquidities.append(liquidity if liquidity is not None else self.get_live_liquidity(position))
+        return liquidities
+
+    def _get_logs_chunked(self, log_filter, from_block, to_block, stop_at_first=False):
+        """eth_getLogs over [from_block, to_block], oldest first, in ranges the provider accepts.
+
+        Starts from the last range size that worked against this RPC and halves it
+        whenever the provider rejects a range as too large. With stop_at_first the
+        scan ends at the first chunk that returns logs.
+        """
+        logs = []
+        chunk = self._logs_chunk_hint
+        start = from_block
+        while start <= to_block:
+            end = min(start + chunk - 1, to_block)
+            try:
+                found = self._rl_call(self.w3.eth.get_logs, dict(log_filter, fromBlock=start, toBlock=end))
+            except Exception as e:
+                if self._is_rate_limit_error(e):
+                    raise  # throttling says nothing about the provider's range limit
+                message = str(e).lower()
+                if chunk > self._logs_min_chunk and any(hint in message for hint in LOG_RANGE_ERROR_HINTS):
+                    chunk = max(self._logs_min_chunk, chunk // 2)
+                    self._logs_chunk_hint = chunk  # remember the provider's limit for later scans
+                    if self.debug_mode:
+                        print(f"⚠️  get_logs range rejected, retrying with {chunk} blocks: {e}")
+                    continue
+                raise
+            if found:
+                logs.extend(found)
+                if stop_at_first:
+                    break
+            start = end + 1
+        return logs
+
+    def _block_timestamp(self, block_number):
+        """Timestamp of a block; blocks are immutable once final, so results are cached"""
+        block_number = int(block_number)
+        ts = self._block_ts_cache.get(block_number)
+        if ts is None:
+            block = self._rl_call(self.w3.eth.get_block, block_number)
+            ts = int(block['timestamp'])
+            self._block_ts_cache[block_number] = ts
+            self._schedule_token_cache_flush()
+        return ts
+
     def get_position_acquired_timestamp(self, token_id, position_manager_address, wallet_address):
         """Return UNIX timestamp when the current wallet initially acquired this tokenId.
         Uses Transfer(to=wallet, tokenId) first occurrence to prevent fee collection from resetting APR.
         """
-        cache_key = (int(token_id), Web3.to_checksum_address(position_manager_address), Web3.to_checksum_address(wallet_address))
+        cache_key = (int(token_id), to_checksum(position_manager_address), to_checksum(wallet_address))
         if cache_key in self._acquired_ts_cache:
             return self._acquired_ts_cache[cache_key]
 
@@ -914,45 +1841,41 @@ class BlockchainManager:
             logs = self._rl_call(self.w3.eth.get_logs, {
                 'fromBlock': 0,
                 'toBlock': 'latest',
-                'address': Web3.to_checksum_address(position_manager_address),
-                'topics': [self._topic_transfer, None, None, id_topic]
+                'address': to_checksum(position_manager_address),
+                'topics': [TRANSFER_TOPIC, None, None, id_topic]
             })
-            wallet_norm = Web3.to_checksum_address(wallet_address)
+            wallet_word = address_to_word(to_checksum(wallet_address))
             
             # Find the FIRST time it was transferred to the wallet (not the most recent)
-            # This prevents fee collection or other operations from resetting the APR calculation
-            first_acquisition_ts = None
+            # This prevents fee collection or other operations from resetting the APR calculation.
+            # Timestamps grow with block number, so only the earliest block needs fetching.
+            first_block = None
             for lg in logs if logs else []:
                 if not lg.get('topics') or len(lg['topics']) < 4:
                     continue
-                try:
-                    to_addr = Web3.to_checksum_address('0x' + lg['topics'][2].hex()[-40:])
-                except Exception:
-                    continue
-                if to_addr == wallet_norm:
-                    block_num = lg['blockNumber']
-                    block = self._rl_call(self.w3.eth.get_block, int(block_num))
-                    ts = int(block['timestamp'])
-                    if first_acquisition_ts is None or ts < first_acquisition_ts:
-                        first_acquisition_ts = ts
-            
+                if bytes(lg['topics'][2]) == wallet_word:
+                    block_num = int(lg['blockNumber'])
+                    if first_block is None or block_num < first_block:
+                        first_block = block_num
+
+            first_acquisition_ts = self._block_timestamp(first_block) if first_block is not None else None
             if first_acquisition_ts:
                 self._acquired_ts_cache[cache_key] = first_acquisition_ts
+                self._schedule_token_cache_flush()
                 return first_acquisition_ts
             # Fallback: first IncreaseLiquidity for this token (often emitted at mint)
             # IncreaseLiquidity only has one indexed arg (tokenId). Filter with 2 topics
             inc_logs = self._rl_call(self.w3.eth.get_logs, {
                 'fromBlock': 0,
                 'toBlock': 'latest',
-                'address': Web3.to_checksum_address(position_manager_address),
-                'topics': [self._topic_increase, id_topic]
+                'address': to_checksum(position_manager_address),
+                'topics': [INCREASE_LIQUIDITY_TOPIC, id_topic]
             })
             if inc_logs:
                 first = inc_logs[0]
-                block_num = first['blockNumber']
-                block = self._rl_call(self.w3.eth.get_block, block_num)
-                ts = int(block['timestamp'])
+                ts = self._block_timestamp(first['blockNumber'])
                 self._acquired_ts_cache[cache_key] = ts
+                self._schedule_token_cache_flush()
                 return ts
         except Exception:
             pass
@@ -975,27 +1898,28 @@ class BlockchainManager:
         Requires an archive-capable RPC. This is best-effort with graceful fallback.
         """
         try:
-            if dex_type == "algebra_integral":
-                pool_contract = self.w3.eth.contract(
-                    address=Web3.to_checksum_address(pool_address),
-                    abi=ALGEBRA_POOL_ABI_V3
-                )
-                global_state = pool_contract.functions.globalState().call(block_identifier=int(block_number))
-                sqrt_price_x96 = global_state[0]
+            selector = GLOBAL_STATE_SELECTOR if dex_type == "algebra_integral" else SLOT0_SELECTOR
+            pool_key = to_checksum(pool_address)
+
+            # Need token decimals to compute human price (pool tokens never change, so an
+            # unknown pair is read in the same historical batch as the price)
+            tokens = self._pool_tokens.get(pool_key)
+            if tokens:
+                sqrt_price_x96, _ = self._read_sqrt_price_tick(pool_key, selector, int(block_number))
             else:
-                pool_contract = self.w3.eth.contract(
-                    address=Web3.to_checksum_address(pool_address),
-                    abi=POOL_ABI
+                state, data0, data1 = self._batch_eth_call(
+                    [(pool_key, selector), (pool_key, TOKEN0_SELECTOR), (pool_key, TOKEN1_SELECTOR)],
+                    block_identifier=int(block_number)
                 )
-                slot0 = pool_contract.functions.slot0().call(block_identifier=int(block_number))
-                sqrt_price_x96 = slot0[0]
-
-            # Need token decimals to compute human price
-            pool_min = self.w3.eth.contract(address=Web3.to_checksum_address(pool_address), abi=MINIMAL_POOL_ABI)
-            token0_addr = pool_min.functions.token0().call()
-            token1_addr = pool_min.functions.token1().call()
-            t0 = self.get_enhanced_token_info(token0_addr)
-            t1 = self.get_enhanced_token_info(token1_addr)
+                if not state or len(state) < 64 or not data0 or not data1 or len(data0) < 32 or len(data1) < 32:
+                    return None
+                sqrt_bytes, _ = _SQRT_PRICE_TICK_WORDS.unpack_from(state, 0)
+                sqrt_price_x96 = int.from_bytes(sqrt_bytes, 'big')
+                tokens = (address_from_word(data0), address_from_word(data1))
+                self._pool_tokens[pool_key] = tokens
+            self._fetch_token_metadata_bulk(tokens)
+            t0 = self.get_enhanced_token_info(tokens[0])
+            t1 = self.get_enhanced_token_info(tokens[1])
             return sqrt_price_to_price(sqrt_price_x96, t0["decimals"], t1["decimals"]) if sqrt_price_x96 else None
         except Exception:
             return None
@@ -1007,7 +1931,7 @@ class BlockchainManager:
         guarantee an accurate historical entry price.
         """
         token_id_for_debug = position.get('token_id', 'N/A')
-        cache_key = (int(position["token_id"]), Web3.to_checksum_address(position["position_manager"]))
+        cache_key = (int(position["token_id"]), to_checksum(position["position_manager"]))
         if cache_key in self._initial_liquidity_cache:
             if self.debug_mode:
                 print(f"DEBUG {token_id_for_debug}: Returning cached entry data.")
@@ -1020,82 +1944,70 @@ class BlockchainManager:
         try:
             token_id = int(position["token_id"])
             id_topic = '0x' + token_id.to_bytes(32, 'big').hex()
-            position_manager = Web3.to_checksum_address(position["position_manager"])
+            position_manager = to_checksum(position["position_manager"])
             
-            # --- Find Creation Block ---
-            creation_block = None
-            current_block = self._rl_call(lambda: self.w3.eth.block_number)
-            if self.debug_mode:
-                print(f"DEBUG {token_id_for_debug}: Current block is {current_block}. Searching last ~12 hours for mint event...")
+            # --- Find Creation Block and Initial Liquidity ---
+            # The mint's IncreaseLiquidity is the token's first one, so one filter on the
+            # indexed tokenId finds creation block and initial amounts (no separate
+            # Transfer-from-zero search). Try the whole chain first so positions older than
+            # the recent window are found too.
+            first_increase = None
+            increase_filter = {
+                'address': position_manager,
+                'topics': [INCREASE_LIQUIDITY_TOPIC, id_topic]
+            }
+            try:
+                increase_logs = self._rl_call(self.w3.eth.get_logs, dict(increase_filter, fromBlock=0, toBlock='latest'))
+                if increase_logs:
+                    first_increase = min(increase_logs, key=lambda lg: (lg['blockNumber'], lg.get('logIndex', 0)))
+            except Exception as e:
+                if self._is_rate_limit_error(e) or not any(hint in str(e).lower() for hint in LOG_RANGE_ERROR_HINTS):
+                    raise
+                if self.debug_mode:
+                    print(f"DEBUG {token_id_for_debug}: Full-range IncreaseLiquidity search rejected ({e}), falling back to a recent window...")
 
-            chunk_size = 2000
-            # Reduced search range to ~12 hours (4000 blocks) to prevent hanging
-            for start_block in range(current_block, max(0, current_block - 4000), -chunk_size):
-                end_block = start_block
-                from_block = max(0, start_block - chunk_size + 1)
-                
+                current_block = self._get_block_number()
+                if current_block is None:
+                    raise ValueError("could not fetch the latest block number")
+                if self.debug_mode:
+                    print(f"DEBUG {token_id_for_debug}: Current block is {current_block}. Searching last ~12 hours for the first IncreaseLiquidity event...")
+
+                # Reduced search range to ~12 hours (4000 blocks) to prevent hanging
+                window_start = max(0, current_block - 4000 + 1)
                 try:
-                    if self.debug_mode:
-                        print(f"DEBUG {token_id_for_debug}: Searching for mint in blocks {from_block}-{end_block}...")
-                    logs = self._rl_call(self.w3.eth.get_logs, {
-                        'fromBlock': from_block,
-                        'toBlock': end_block,
-                        'address': position_manager,
-                        'topics': [self._topic_transfer, '0x0000000000000000000000000000000000000000000000000000000000000000', None, id_topic]
-                    })
-                    if logs:
-                        creation_block = logs[0]['blockNumber']
-                        if self.debug_mode:
-                            print(f"DEBUG {token_id_for_debug}: Found mint event in block range {from_block}-{end_block}. Creation Block: {creation_block}")
-                        break 
+                    increase_logs = self._get_logs_chunked(increase_filter, window_start, current_block, stop_at_first=True)
+                    if increase_logs:
+                        first_increase = increase_logs[0]
                 except Exception as e:
                     if self.debug_mode:
-                        print(f"DEBUG {token_id_for_debug}: (Info) No mint event found in blocks {from_block}-{end_block}. Error: {e}")
-            
-            if not creation_block:
-                if self.debug_mode:
-                    print(f"DEBUG {token_id_for_debug}: Mint event not found. Will rely on IncreaseLiquidity event to find block.")
+                        print(f"DEBUG {token_id_for_debug}: (Info) IncreaseLiquidity search failed in blocks {window_start}-{current_block}. Error: {e}")
 
-            # --- Get Initial Liquidity Amounts ---
-            search_block_start = creation_block if creation_block else max(0, current_block - 4000)
-            # Widen the search range slightly in case of block reorganization or timing issues
-            search_block_end = creation_block + 50 if creation_block else current_block
-            if self.debug_mode:
-                print(f"DEBUG {token_id_for_debug}: Searching for IncreaseLiquidity event in blocks {search_block_start}-{search_block_end}...")
-
-            increase_logs = self._rl_call(self.w3.eth.get_logs, {
-                'fromBlock': search_block_start,
-                'toBlock': search_block_end,
-                'address': position_manager,
-                'topics': [self._topic_increase, id_topic]
-            })
-
-            if not increase_logs:
+            if first_increase is None:
                 if self.debug_mode:
                     print(f"DEBUG {token_id_for_debug}: CRITICAL - Could not find any IncreaseLiquidity event for token. Cannot determine entry.")
                 self._initial_liquidity_cache[cache_key] = None
                 return None
 
-            first_increase = increase_logs[0]
-            if not creation_block:
-                 creation_block = first_increase['blockNumber']
-                 if self.debug_mode:
-                    print(f"DEBUG {token_id_for_debug}: Using block {creation_block} from the first IncreaseLiquidity event.")
+            creation_block = first_increase['blockNumber']
+            if self.debug_mode:
+                print(f"DEBUG {token_id_for_debug}: Using block {creation_block} from the first IncreaseLiquidity event.")
 
             # --- Extract Amounts and Timestamp ---
             if self.debug_mode:
                 print(f"DEBUG {token_id_for_debug}: Extracting data from IncreaseLiquidity event at block {creation_block}...")
-            data_bytes = bytes.fromhex(first_increase['data'][2:])
-            amount0_wei = int.from_bytes(data_bytes[32:64], 'big')
-            amount1_wei = int.from_bytes(data_bytes[64:96], 'big')
-
-            decimals0 = position["token0_info"]["decimals"]
-            decimals1 = position["token1_info"]["decimals"]
-            amount0 = amount0_wei / (10 ** decimals0)
-            amount1 = amount1_wei / (10 ** decimals1)
-
-            blk = self._rl_call(self.w3.eth.get_block, creation_block)
-            ts = int(blk['timestamp'])
+            raw_data = first_increase['data']
+            # web3 returns log data as HexBytes (a bytes subclass, unpacked in place);
+            # older providers hand back a hex string
+            if isinstance(raw_data, str):
+                raw_data = bytes.fromhex(raw_data[2:] if raw_data.startswith('0x') else raw_data)
+            amount0_word, amount1_word = _INCREASE_LIQUIDITY_AMOUNT_WORDS.unpack_from(raw_data, 0)
+            amount0_wei = int.from_bytes(amount0_word, 'big')
+            amount1_wei = int.from_bytes(amount1_word, 'big')
+
+            amount0 = amount0_wei / position["token0_info"]["wei_divisor"]
+            amount1 = amount1_wei / position["token1_info"]["wei_divisor"]
+
+            ts = self._block_timestamp(creation_block)
             if self.debug_mode:
                 print(f"DEBUG {token_id_for_debug}: Initial amounts: {amount0:.4f} T0, {amount1:.4f} T1 at timestamp {ts}")
 
@@ -1155,6 +2067,8 @@ class BlockchainManager:
                 'entry_value_usd': entry_value_usd
             }
             self._initial_liquidity_cache[cache_key] = result
+            if entry_price:
+                self._schedule_token_cache_flush()
             return result
 
         except Exception as e:
@@ -1165,8 +2079,11 @@ class BlockchainManager:
             self._initial_liquidity_cache[cache_key] = None
             return None
 
-    def check_position_status(self, position, wallet_address):
-        """Check position status with fee tracking"""
+    def check_position_status(self, position, wallet_address, fee_data=None):
+        """Check position status with fee tracking.
+
+        fee_data may be supplied from get_unclaimed_fees_bulk to skip the per-position collect() call.
+        """
         dex_type = position.get("dex_type", "uniswap_v3")
         pool_data = self.get_pool_data_flexible(position["pool_address"], dex_type)
         
@@ -1180,9 +2097,11 @@ class BlockchainManager:
         # Check if position is in range
         in_range = lower_tick <= current_tick <= upper_tick
         
-        # Calculate distances
+        # Calculate distances (the edge percentage once here, for display, notifications and IL analysis)
         distance_to_lower = current_tick - lower_tick
         distance_to_upper = upper_tick - current_tick
+        range_size = upper_tick - lower_tick
+        closer_distance_pct = min(distance_to_lower, distance_to_upper) / range_size * 100 if range_size else None
         
         # Calculate prices with correct decimals
         decimals0 = pool_data["token0_decimals"]
@@ -1202,8 +2121,9 @@ class BlockchainManager:
             position["liquidity"], lower_tick, upper_tick, decimals0, decimals1
         )
         
-        # Get unclaimed fees
-        fee_data = self.get_unclaimed_fees(position, wallet_address)
+        # Get unclaimed fees (unless already fetched in bulk)
+        if fee_data is None:
+            fee_data = self.get_unclaimed_fees(position, wallet_address)
         # Get acquisition timestamp and initial entry data
         acquired_ts = self.get_position_acquired_timestamp(position['token_id'], position['position_manager'], wallet_address)
         initial_entry = self.get_initial_position_entry(position, wallet_address)
@@ -1225,6 +2145,7 @@ class BlockchainManager:
             "upper_price": upper_price,
             "distance_to_lower": distance_to_lower,
             "distance_to_upper": distance_to_upper,
+            "closer_distance_pct": closer_distance_pct,
             "token0_symbol": pool_data["token0_symbol"],
             "token1_symbol": pool_data["token1_symbol"],
             "token_id": position["token_id"],
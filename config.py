@@ -11,29 +11,141 @@ Developer: 8roku8.hl
 
 import json
 import os
-import copy
-from constants import DEFAULT_CONFIG, CONFIG_FILE
-from utils import validate_dex_configs
+import sys
+from constants import DEFAULT_CONFIG, CONFIG_FILE, SCHEMA_VERSION
+
+# Optional faster JSON backend for reading/writing the config file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_loads(data):
+    """Parse JSON from bytes/str with orjson when installed (its errors subclass json.JSONDecodeError)"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _json_dumps_pretty(obj):
+    """Indented UTF-8 JSON bytes for the config file (orjson only supports 2-space indents)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=4).encode("utf-8")
+
+# DEFAULT_CONFIG is plain JSON data; cloning from its serialized form is cheaper than copy.deepcopy
+_DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG)
+
+_MISSING = object()  # sentinel for keys absent from a loaded config
+
+# Accepted answers to y/n prompts
+_YES = frozenset(("y", "yes"))
+_NO = frozenset(("n", "no"))
+
+# Setup menu answers -> settings (anything else picks the default)
+_PLAIN_DISPLAY_MODES = {  # display mode choice -> (color_scheme, message); default is Rich UI
+    "2": ("minimal", "📺 Simple colored text display selected"),
+    "3": ("none", "📺 Plain text display selected"),
+}
+_TABLE_STYLE_CHOICES = {"2": "simple", "3": "double"}  # default "rounded"
+_ALGEBRA_DEX_NAMES = frozenset(("gliquid", "quickswap"))  # DEXes known to run Algebra Integral
+_DEX_TYPE_CHOICES = {  # one-line DEX entry type field -> dex type
+    "1": "uniswap_v3", "uniswap_v3": "uniswap_v3",
+    "2": "algebra_integral", "algebra_integral": "algebra_integral",
+}
+_QUICK_COOLDOWN_FIELDS = {  # one-line cooldown key -> (smart_cooldowns field, seconds per unit, default)
+    "out": ("same_out_of_range", 60, 30),
+    "danger": ("same_danger", 60, 60),
+    "warn": ("same_warning", 60 * 60, 2),
+    "safe": ("same_safe", 60 * 60, 6),
+}
+
+def _flatten_defaults(section, parents=()):
+    """Leaf entries of DEFAULT_CONFIG as (parent keys, key, value, is_container), in definition order.
+    Containers (lists, empty dicts) are stored serialized so every merge inserts a fresh copy."""
+    leaves = []
+    for key, value in section.items():
+        if type(value) is dict and value:
+            leaves.extend(_flatten_defaults(value, parents + (key,)))
+        elif isinstance(value, (dict, list)):
+            leaves.append((parents, key, json.dumps(value), True))
+        else:
+            leaves.append((parents, key, value, False))
+    return leaves
+
+# Walked once here so each merge is a flat loop over leaf paths
+_DEFAULT_LEAVES = tuple(_flatten_defaults(DEFAULT_CONFIG))
+
+# Static setup text, each written to stdout in one call
+_BANNER = (
+    "╔══════════════════════════════════════════════════════════════╗\n"
+    "║              WELCOME TO HYPEREVM LP MONITOR                 ║\n"
+    "║                    First Time Setup                         ║\n"
+    "╚══════════════════════════════════════════════════════════════╝\n"
+    "\n"
+)
+_NOTIFICATIONS_INTRO = (
+    "\n🔔 SMART NOTIFICATION SETUP\n"
+    "Get intelligent notifications about your LP positions!\n"
+    "Smart notifications track each position individually and avoid spam:\n"
+    "  ✅ Immediate alerts when positions change status\n"
+    "  ⏰ Smart cooldowns prevent repeated notifications\n"
+    "  📊 Escalation alerts when situations get worse\n"
+    "  🎯 Resolution alerts when danger passes\n"
+)
+_COOLDOWNS_OVERVIEW = (
+    "\n⚙️  Smart Notification Settings:\n"
+    "Smart notifications use different cooldown periods:\n"
+    "  🚨 Status changes: Immediate (no cooldown)\n"
+    "  ❌ Out-of-range: 30 min cooldown\n"
+    "  🚨 Danger zone: 60 min cooldown\n"
+    "  ⚠️  Warning zone: 2 hour cooldown\n"
+    "  ✅ Safe positions: 6 hour cooldown\n"
+)
+
+# Last merged config by (mtime_ns, size) of CONFIG_FILE, kept serialized so each caller gets its own copy
+_config_cache = {"key": None, "json": None}
+
+def _config_file_key():
+    st = os.stat(CONFIG_FILE)
+    return (st.st_mtime_ns, st.st_size)
 
 def load_config():
     """Load configuration from JSON file, create default if doesn't exist"""
-    if not os.path.exists(CONFIG_FILE):
+    try:
+        file_key = _config_file_key()
+    except FileNotFoundError:
         print("⚙️  Configuration file not found. Creating default config...")
         save_config(DEFAULT_CONFIG)
         print(f"✅ Created {CONFIG_FILE}")
         print("📝 Please edit the configuration file and restart the monitor.")
         return None
+    except OSError as e:
+        print(f"❌ Error loading config: {e}")
+        return None
+
+    # Unchanged file: skip re-reading, re-parsing and re-merging defaults
+    if _config_cache["key"] == file_key:
+        return _json_loads(_config_cache["json"])
     
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
+        # One unbuffered read of the whole file; the parser decodes the UTF-8 bytes itself
+        with open(CONFIG_FILE, 'rb', buffering=0) as f:
+            data = f.readall()
+        config = _json_loads(data)
         
-        # Update config with any missing default values
-        updated = update_config_with_defaults(config)
-        if updated:
+        # Update config with any missing default values (only when saved under an older schema)
+        if config.get("schema_version") != SCHEMA_VERSION:
+            updated = update_config_with_defaults(config)
+            config["schema_version"] = SCHEMA_VERSION
+            config.pop("_schema_hash", None)  # stamp used by earlier builds
             save_config(config)
-            print("📝 Updated configuration with new settings")
+            if updated:
+                print("📝 Updated configuration with new settings")
+            file_key = _config_file_key()
+            data = orjson.dumps(config) if ORJSON_AVAILABLE else json.dumps(config)
         
+        # Common case: the bytes just read are already the cache entry, no re-serialization
+        _config_cache["key"] = file_key
+        _config_cache["json"] = data
         return config
     except json.JSONDecodeError as e:
         print(f"❌ Error reading config file: {e}")
@@ -44,30 +156,50 @@ def load_config():
 
 def save_config(config):
     """Save configuration to JSON file"""
+    _config_cache["key"] = None
+    # Serialize once, write it in one call to a temp file and swap it in atomically,
+    # so a crash mid-write can never leave a truncated config behind
+    tmp_path = f"{CONFIG_FILE}.tmp"
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        payload = _json_dumps_pretty(config)
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            # Keep the existing file's permissions (it may hold bot tokens)
+            os.chmod(tmp_path, os.stat(CONFIG_FILE).st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, CONFIG_FILE)
     except Exception as e:
         print(f"❌ Error saving config: {e}")
 
 def update_config_with_defaults(config):
     """Update configuration with any missing default values"""
     updated = False
-    
-    def update_nested_dict(target, source):
-        nonlocal updated
-        for key, value in source.items():
+    for parents, key, value, is_container in _DEFAULT_LEAVES:
+        target = config
+        for parent in parents:
+            section = target.get(parent, _MISSING)
+            if section is _MISSING:
+                section = target[parent] = {}
+            elif type(section) is not dict:
+                break  # user replaced a section with a non-dict value; leave it alone
+            target = section
+        else:
             if key not in target:
-                target[key] = value
+                # Copy containers so the loaded config never shares them with DEFAULT_CONFIG
+                target[key] = json.loads(value) if is_container else value
                 updated = True
-            elif isinstance(value, dict) and isinstance(target[key], dict):
-                update_nested_dict(target[key], value)
-    
-    update_nested_dict(config, DEFAULT_CONFIG)
     return updated
 
-def validate_config(config):
-    """Validate configuration and return True if valid"""
+def validate_config(config, validate_dexes=True):
+    """Validate configuration and return True if valid
+
+    validate_dexes=False skips the per-DEX field check, for configs whose DEXes
+    were just entered through setup_first_run in this session.
+    """
     if not config.get("wallet_address"):
         print(f"❌ Wallet address not set. Please edit {CONFIG_FILE}")
         return False
@@ -78,32 +210,63 @@ def validate_config(config):
         return False
     
     # Validate DEX configurations
-    valid_dexes = validate_dex_configs(config["dexes"])
-    if len(valid_dexes) == 0:
-        print(f"❌ No valid DEXes found. Please check your configuration in {CONFIG_FILE}")
+    if validate_dexes:
+        from utils import validate_dex_configs
+        valid_dexes = validate_dex_configs(config["dexes"])
+        if len(valid_dexes) == 0:
+            print(f"❌ No valid DEXes found. Please check your configuration in {CONFIG_FILE}")
+            return False
+        
+        config["dexes"] = valid_dexes
+    else:
+        valid_dexes = config["dexes"]
+
+    # Normalize addresses once at load so hot paths never re-checksum them
+    # (web3 is imported here: it is the slowest import by far and nothing else in this module needs it)
+    from web3 import Web3
+    try:
+        config["wallet_address"] = Web3.to_checksum_address(config["wallet_address"])
+    except ValueError:
+        print(f"❌ Invalid wallet address: {config['wallet_address']}")
         return False
-    
-    config["dexes"] = valid_dexes
+    for dex in valid_dexes:
+        try:
+            dex["position_manager"] = Web3.to_checksum_address(dex["position_manager"])
+        except ValueError:
+            print(f"⚠️  Invalid position manager address for {dex['name']}: {dex['position_manager']}")
     return True
 
+def _parse_int(text, default=None):
+    """Non-negative integer typed at a prompt, or default for blank/invalid/negative input"""
+    try:
+        value = int(text)
+    except (TypeError, ValueError):
+        return default
+    return value if value >= 0 else default
+
 def setup_first_run():
     """Interactive setup for first-time users with smart notification system and Rich UI"""
-    print("╔══════════════════════════════════════════════════════════════╗")
-    print("║              WELCOME TO HYPEREVM LP MONITOR                 ║")
-    print("║                    First Time Setup                         ║")
-    print("╚══════════════════════════════════════════════════════════════╝")
-    print()
+    sys.stdout.write(_BANNER)
     
-    # Use deep copy to avoid mutating DEFAULT_CONFIG's nested structures
-    config = copy.deepcopy(DEFAULT_CONFIG)
+    # Fresh copy so setup never mutates DEFAULT_CONFIG's nested structures
+    config = json.loads(_DEFAULT_CONFIG_JSON)
     
     print(f"Let's set up your LP monitor. You can modify these settings later in {CONFIG_FILE}\n")
     
     # Display preferences (Rich UI + color scheme)
     config = setup_display_preferences(config)
     
-    # Wallet setup
-    config = setup_wallet(config)
+    # Wallet setup (checksummed here, like the position managers in setup_dexes)
+    from web3 import Web3
+    while True:
+        wallet = input("\nEnter your wallet address: ").strip()
+        if not wallet:
+            break
+        try:
+            config["wallet_address"] = Web3.to_checksum_address(wallet)
+            break
+        except ValueError:
+            print(f"❌ Invalid address: {wallet}")
     
     # DEX setup
     config = setup_dexes(config)
@@ -127,36 +290,29 @@ def setup_first_run():
 
 def setup_display_preferences(config):
     """Setup display preferences including Rich UI and color schemes"""
+    display_settings = config["display_settings"]
     print("🎨 Display Preferences:")
     
     # Rich UI option
-    print("\n📺 Display Options:")
-    print("1. Rich UI with beautiful tables (recommended)")
-    print("2. Simple colored text")
-    print("3. Plain text (no colors)")
+    choice = _prompt_display_mode("\n📺 Display Options:")
     
-    choice = input("Choose display mode (1-3, default: 1): ").strip()
-    
-    if choice == "2":
-        config["display_settings"]["use_rich_ui"] = False
-        config["display_settings"]["color_scheme"] = "minimal"
-        print("📺 Simple colored text display selected")
-    elif choice == "3":
-        config["display_settings"]["use_rich_ui"] = False
-        config["display_settings"]["color_scheme"] = "none"
-        print("📺 Plain text display selected")
+    if choice in _PLAIN_DISPLAY_MODES:
+        color_scheme, message = _PLAIN_DISPLAY_MODES[choice]
+        display_settings["use_rich_ui"] = False
+        display_settings["color_scheme"] = color_scheme
+        print(message)
     else:
-        config["display_settings"]["use_rich_ui"] = True
-        config["display_settings"]["color_scheme"] = "rich"
+        display_settings["use_rich_ui"] = True
+        display_settings["color_scheme"] = "rich"
         print("📺 Rich UI enabled - enjoy beautiful tables and visualizations!")
         
         # Additional Rich UI options
         compact_input = input("\nUse compact display mode? (y/n, default: n): ").strip().lower()
-        if compact_input in ['y', 'yes']:
-            config["display_settings"]["compact_mode"] = True
+        if compact_input in _YES:
+            display_settings["compact_mode"] = True
             print("📺 Compact mode enabled - more positions visible at once")
         else:
-            config["display_settings"]["compact_mode"] = False
+            display_settings["compact_mode"] = False
             print("📺 Full display mode - detailed position information")
         
         # Table style for Rich UI
@@ -166,38 +322,25 @@ def setup_display_preferences(config):
         print("3. Double borders")
         
         style_choice = input("Choose table style (1-3, default: 1): ").strip()
-        if style_choice == "2":
-            config["display_settings"]["table_style"] = "simple"
-        elif style_choice == "3":
-            config["display_settings"]["table_style"] = "double"
-        else:
-            config["display_settings"]["table_style"] = "rounded"
+        display_settings["table_style"] = _TABLE_STYLE_CHOICES.get(style_choice, "rounded")
         
-        print(f"📊 Table style: {config['display_settings']['table_style']}")
+        print(f"📊 Table style: {display_settings['table_style']}")
     
     return config
 
-def get_color_scheme_from_user():
-    """Legacy function for backward compatibility"""
-    print("📺 Display Options:")
+def _prompt_display_mode(heading="📺 Display Options:"):
+    """Show the display mode menu and return the raw choice"""
+    print(heading)
     print("1. Rich UI with beautiful tables (recommended)")
     print("2. Simple colored text")
     print("3. Plain text (no colors)")
     
-    choice = input("Choose display mode (1-3, default: 1): ").strip()
-    if choice == "2":
-        return "minimal"
-    elif choice == "3":
-        return "none"
-    else:
-        return "rich"
+    return input("Choose display mode (1-3, default: 1): ").strip()
 
-def setup_wallet(config):
-    """Setup wallet address"""
-    wallet = input("\nEnter your wallet address: ").strip()
-    if wallet:
-        config["wallet_address"] = wallet
-    return config
+def get_color_scheme_from_user():
+    """Legacy function for backward compatibility"""
+    choice = _prompt_display_mode()
+    return _PLAIN_DISPLAY_MODES[choice][0] if choice in _PLAIN_DISPLAY_MODES else "rich"
 
 def setup_dexes(config):
     """Setup DEX configurations"""
@@ -205,23 +348,49 @@ def setup_dexes(config):
     print("Popular DEXes on HyperEVM: Hybra Finance, HyperSwap, Ramses, Laminar, Kittenswap, Gliquid")
     print("Note: Gliquid uses Algebra Integral - now with enhanced tick parsing!")
     
+    # Checksum addresses here so validate_config and the monitor get them already normalized
+    from web3 import Web3  # already loaded by setup_first_run's wallet prompt
+    
     dexes = []
     dex_count = 1
     
     while True:
         print(f"\n--- DEX #{dex_count} ---")
         
-        dex_name = input("Enter DEX name (or press Enter to finish): ").strip()
-        if not dex_name:
+        entry = input("Enter DEX name, or name,address[,type 1/2] on one line (or press Enter to finish): ").strip()
+        if not entry:
             break
-            
-        position_manager = input(f"Enter NonFungiblePositionManager contract address for {dex_name}: ").strip()
-        if not position_manager:
-            print(f"⚠️  Skipping {dex_name} - no position manager provided")
-            continue
         
-        # Ask about DEX type for better compatibility
-        dex_type = determine_dex_type(dex_name)
+        dex_name, _, rest = entry.partition(",")
+        dex_name = dex_name.strip()
+        if rest:
+            # One-line form: everything for this DEX from a single prompt
+            address, _, type_choice = rest.partition(",")
+            type_choice = type_choice.strip().lower() or ("2" if dex_name.lower() in _ALGEBRA_DEX_NAMES else "1")
+            dex_type = _DEX_TYPE_CHOICES.get(type_choice)
+            try:
+                position_manager = Web3.to_checksum_address(address.strip())
+            except ValueError:
+                position_manager = None
+            if not dex_name or position_manager is None or dex_type is None:
+                print(f"❌ Could not parse '{entry}' - expected name,address[,type 1/2]")
+                continue
+        else:
+            while True:
+                position_manager = input(f"Enter NonFungiblePositionManager contract address for {dex_name}: ").strip()
+                if not position_manager:
+                    break
+                try:
+                    position_manager = Web3.to_checksum_address(position_manager)
+                    break
+                except ValueError:
+                    print(f"❌ Invalid address: {position_manager} (press Enter to skip this DEX)")
+            if not position_manager:
+                print(f"⚠️  Skipping {dex_name} - no position manager provided")
+                continue
+            
+            # Ask about DEX type for better compatibility
+            dex_type = determine_dex_type(dex_name)
         
         dexes.append({
             "name": dex_name,
@@ -235,7 +404,7 @@ def setup_dexes(config):
         # Ask if they want to add more
         if dex_count > 5:  # Reasonable limit
             more = input("Add another DEX? (y/n): ").strip().lower()
-            if more != 'y' and more != 'yes':
+            if more not in _YES:
                 break
     
     config["dexes"] = dexes
@@ -245,9 +414,9 @@ def determine_dex_type(dex_name):
     """Determine DEX type based on name or user input"""
     dex_type = "uniswap_v3"  # Default
     
-    if dex_name.lower() in ["gliquid", "quickswap"]:
+    if dex_name.lower() in _ALGEBRA_DEX_NAMES:
         type_input = input(f"Is {dex_name} using Algebra Integral? (y/n, default: y): ").strip().lower()
-        if type_input != 'n' and type_input != 'no':
+        if type_input not in _NO:
             dex_type = "algebra_integral"
     else:
         type_input = input("DEX type - (1) Uniswap V3 (default), (2) Algebra Integral: ").strip()
@@ -258,13 +427,13 @@ def determine_dex_type(dex_name):
 
 def setup_optional_settings(config):
     """Setup optional monitoring settings"""
+    display_settings = config["display_settings"]
     # Monitoring interval
     interval_input = input(f"\nCheck interval in seconds (default: 30): ").strip()
-    if interval_input.isdigit():
-        config["check_interval"] = int(interval_input)
+    config["check_interval"] = _parse_int(interval_input, config["check_interval"])
     
     # Screen clearing
-    if config["display_settings"].get("use_rich_ui", True):
+    if display_settings.get("use_rich_ui", True):
         # Rich UI: Choose between live display and screen clearing
         print("\n📺 Display Update Method:")
         print("1. Persistent Live Display (smooth, no flicker)")
@@ -272,35 +441,35 @@ def setup_optional_settings(config):
         display_choice = input("Choose display method (1-2, default: 1): ").strip()
         
         if display_choice == "2":
-            config["display_settings"]["use_live_display"] = False
-            config["display_settings"]["clear_screen"] = True
+            display_settings["use_live_display"] = False
+            display_settings["clear_screen"] = True
             print("📺 Screen clearing mode enabled - traditional display")
         else:
-            config["display_settings"]["use_live_display"] = True
-            config["display_settings"]["clear_screen"] = False
+            display_settings["use_live_display"] = True
+            display_settings["clear_screen"] = False
             print("🔴 Live display mode enabled - smooth persistent updates")
     else:
         # For simple text, scrolling might be preferred
         clear_screen_input = input(f"\nEnable screen clearing? (y/n, default: n): ").strip().lower()
-        if clear_screen_input in ['y', 'yes']:
-            config["display_settings"]["clear_screen"] = True
+        if clear_screen_input in _YES:
+            display_settings["clear_screen"] = True
             print("📺 Screen clearing enabled")
         else:
-            config["display_settings"]["clear_screen"] = False
+            display_settings["clear_screen"] = False
             print("📺 Screen clearing disabled - output will scroll")
     
     # Fee tracking
     fees_input = input(f"\nEnable unclaimed fee tracking? (y/n, default: y): ").strip().lower()
-    if fees_input in ['n', 'no']:
-        config["display_settings"]["show_unclaimed_fees"] = False
+    if fees_input in _NO:
+        display_settings["show_unclaimed_fees"] = False
         print("💰 Fee tracking disabled")
     else:
-        config["display_settings"]["show_unclaimed_fees"] = True
+        display_settings["show_unclaimed_fees"] = True
         print("💰 Fee tracking enabled - will show unclaimed fees")
 
     # PnL/IL tracking settings
     pnl_input = input(f"\nEnable PnL/IL tracking with a local database? (y/n, default: y): ").strip().lower()
-    if pnl_input in ['n', 'no']:
+    if pnl_input in _NO:
         config.setdefault("pnl_settings", {})["enabled"] = False
         print("📉 PnL/IL tracking disabled")
     else:
@@ -311,42 +480,37 @@ def setup_optional_settings(config):
         if db_path:
             config["pnl_settings"]["database_path"] = db_path
         include_il = input("Include IL metrics in tables and notifications? (y/n, default: y): ").strip().lower()
-        config["pnl_settings"]["include_il_metrics"] = not (include_il in ['n', 'no'])
+        config["pnl_settings"]["include_il_metrics"] = include_il not in _NO
     
     # Debug mode
     debug_input = input(f"\nEnable debug mode for troubleshooting? (y/n): ").strip().lower()
-    if debug_input in ['y', 'yes']:
-        config["display_settings"]["debug_mode"] = True
+    if debug_input in _YES:
+        display_settings["debug_mode"] = True
         print("🔍 Debug mode enabled - will show detailed calculation info")
     
     # Rich UI specific: Show animations
-    if config["display_settings"].get("use_rich_ui", True):
+    if display_settings.get("use_rich_ui", True):
         animations_input = input(f"\nShow loading animations and progress bars? (y/n, default: y): ").strip().lower()
-        if animations_input in ['n', 'no']:
-            config["display_settings"]["refresh_animation"] = False
+        if animations_input in _NO:
+            display_settings["refresh_animation"] = False
             print("🎬 Animations disabled")
         else:
-            config["display_settings"]["refresh_animation"] = True
+            display_settings["refresh_animation"] = True
             print("🎬 Animations enabled - smoother visual feedback")
     
     return config
 
 def setup_notifications(config):
     """Setup notification system with smart per-position tracking"""
-    print(f"\n🔔 SMART NOTIFICATION SETUP")
-    print("Get intelligent notifications about your LP positions!")
-    print("Smart notifications track each position individually and avoid spam:")
-    print("  ✅ Immediate alerts when positions change status")
-    print("  ⏰ Smart cooldowns prevent repeated notifications")
-    print("  📊 Escalation alerts when situations get worse")
-    print("  🎯 Resolution alerts when danger passes")
+    notifications = config["notifications"]
+    sys.stdout.write(_NOTIFICATIONS_INTRO)
     
     enable_notifications = input("\nEnable smart notifications? (y/n): ").strip().lower()
-    if enable_notifications not in ['y', 'yes']:
+    if enable_notifications not in _YES:
         print("🔔 Notifications disabled")
         return config
     
-    config["notifications"]["enabled"] = True
+    notifications["enabled"] = True
     
     # Choose notification method
     print(f"\n📋 Choose your notification method:")
@@ -355,10 +519,9 @@ def setup_notifications(config):
     
     choice = input("Enter choice (1-2): ").strip()
     
-    if choice == "1":
-        config = setup_telegram_notifications(config)
-    elif choice == "2":
-        config = setup_discord_notifications(config)
+    setup_method = _NOTIFICATION_SETUP.get(choice)
+    if setup_method:
+        config = setup_method(config)
     
     # Smart notification preferences
     config = setup_smart_notification_preferences(config)
@@ -368,19 +531,14 @@ def setup_notifications(config):
 
 def setup_smart_notification_preferences(config):
     """Setup smart notification preferences with per-position cooldowns"""
-    print(f"\n⚙️  Smart Notification Settings:")
+    notifications = config["notifications"]
     
     # Explain the smart system
-    print("Smart notifications use different cooldown periods:")
-    print("  🚨 Status changes: Immediate (no cooldown)")
-    print("  ❌ Out-of-range: 30 min cooldown")  
-    print("  🚨 Danger zone: 60 min cooldown")
-    print("  ⚠️  Warning zone: 2 hour cooldown")
-    print("  ✅ Safe positions: 6 hour cooldown")
+    sys.stdout.write(_COOLDOWNS_OVERVIEW)
     
     # Ask if they want to customize cooldowns
     customize = input("\nCustomize cooldown periods? (y/n, default: n): ").strip().lower()
-    if customize in ['y', 'yes']:
+    if customize in _YES:
         config = setup_custom_cooldowns(config)
     else:
         print("✅ Using default smart cooldown periods")
@@ -390,84 +548,98 @@ def setup_smart_notification_preferences(config):
     print("Prevents notification overload during market volatility.")
     
     global_cooldown_input = input("Minimum time between any notifications (minutes, default: 15): ").strip()
-    if global_cooldown_input.isdigit():
-        global_cooldown_seconds = int(global_cooldown_input) * 60
-        config["notifications"]["notification_cooldown"] = global_cooldown_seconds
-        print(f"✅ Set global cooldown to {global_cooldown_input} minutes")
+    global_cooldown_minutes = _parse_int(global_cooldown_input)
+    if global_cooldown_minutes is not None:
+        notifications["notification_cooldown"] = global_cooldown_minutes * 60
+        print(f"✅ Set global cooldown to {global_cooldown_minutes} minutes")
     else:
-        config["notifications"]["notification_cooldown"] = 900  # 15 minutes default
+        notifications["notification_cooldown"] = 900  # 15 minutes default
         print("✅ Using default 15-minute global cooldown")
     
     # Include fees in notifications
     if config.get("display_settings", {}).get("show_unclaimed_fees", True):
         include_fees = input("\nInclude fee information in notifications? (y/n, default: y): ").strip().lower()
-        if include_fees in ['n', 'no']:
-            config["notifications"]["include_fees_in_notifications"] = False
+        if include_fees in _NO:
+            notifications["include_fees_in_notifications"] = False
             print("💰 Fee information will not be included in notifications")
         else:
-            config["notifications"]["include_fees_in_notifications"] = True
+            notifications["include_fees_in_notifications"] = True
             print("💰 Fee information will be included in notifications")
 
     # Include IL in notifications
     if config.get("pnl_settings", {}).get("enabled", True) and config.get("pnl_settings", {}).get("include_il_metrics", True):
         include_il = input("Include IL information in notifications? (y/n, default: y): ").strip().lower()
-        config["notifications"]["include_il_in_notifications"] = not (include_il in ['n', 'no'])
+        notifications["include_il_in_notifications"] = include_il not in _NO
     
     # Issues-only mode (still useful for very conservative users)
     issues_only = input("\nOnly notify about problems (skip all safe position updates)? (y/n, default: n): ").strip().lower()
-    if issues_only in ['y', 'yes']:
-        config["notifications"]["notify_on_issues_only"] = True
+    if issues_only in _YES:
+        notifications["notify_on_issues_only"] = True
         print("✅ Will only notify about out-of-range, danger, and warning positions")
     else:
-        config["notifications"]["notify_on_issues_only"] = False
+        notifications["notify_on_issues_only"] = False
         print("✅ Will send smart updates for all position changes")
     
     return config
 
 def setup_custom_cooldowns(config):
     """Allow users to customize cooldown periods"""
+    notifications = config["notifications"]
     print(f"\n⚙️  Customize Cooldown Periods:")
     
     # Initialize smart_cooldowns section if not exists
-    if "smart_cooldowns" not in config["notifications"]:
-        config["notifications"]["smart_cooldowns"] = {}
+    if "smart_cooldowns" not in notifications:
+        notifications["smart_cooldowns"] = {}
+    
+    cooldowns = notifications["smart_cooldowns"]
     
-    cooldowns = config["notifications"]["smart_cooldowns"]
+    # One-line form for users who know what they want
+    quick = input("Enter all as out=30,danger=60,warn=2,safe=6 (minutes/minutes/hours/hours) or press Enter to be asked one by one: ").strip()
+    if quick:
+        parsed = _parse_cooldowns(quick)
+        if parsed is not None:
+            cooldowns.update(parsed)
+            print("✅ Custom cooldown periods configured!")
+            return config
+        print("⚠️  Could not parse that, asking one by one instead")
     
     # Out of range cooldown
     out_of_range_input = input("Out-of-range position cooldown (minutes, default: 30): ").strip()
-    if out_of_range_input.isdigit():
-        cooldowns["same_out_of_range"] = int(out_of_range_input) * 60
-    else:
-        cooldowns["same_out_of_range"] = 30 * 60
+    cooldowns["same_out_of_range"] = _parse_int(out_of_range_input, 30) * 60
     
     # Danger cooldown  
     danger_input = input("Danger zone cooldown (minutes, default: 60): ").strip()
-    if danger_input.isdigit():
-        cooldowns["same_danger"] = int(danger_input) * 60
-    else:
-        cooldowns["same_danger"] = 60 * 60
+    cooldowns["same_danger"] = _parse_int(danger_input, 60) * 60
     
     # Warning cooldown
     warning_input = input("Warning zone cooldown (hours, default: 2): ").strip()
-    if warning_input.isdigit():
-        cooldowns["same_warning"] = int(warning_input) * 60 * 60
-    else:
-        cooldowns["same_warning"] = 2 * 60 * 60
+    cooldowns["same_warning"] = _parse_int(warning_input, 2) * 60 * 60
     
     # Safe cooldown
     safe_input = input("Safe position cooldown (hours, default: 6): ").strip()
-    if safe_input.isdigit():
-        cooldowns["same_safe"] = int(safe_input) * 60 * 60
-    else:
-        cooldowns["same_safe"] = 6 * 60 * 60
+    cooldowns["same_safe"] = _parse_int(safe_input, 6) * 60 * 60
     
     print("✅ Custom cooldown periods configured!")
     return config
 
+def _parse_cooldowns(text):
+    """Parse "out=30,danger=60,warn=2,safe=6" into smart_cooldowns seconds; None if malformed.
+    Omitted fields keep their defaults."""
+    cooldowns = {field: default * unit for field, unit, default in _QUICK_COOLDOWN_FIELDS.values()}
+    for item in text.split(","):
+        name, sep, amount = item.partition("=")
+        field_spec = _QUICK_COOLDOWN_FIELDS.get(name.strip().lower())
+        value = _parse_int(amount.strip())
+        if not sep or field_spec is None or value is None:
+            return None
+        field, unit, _ = field_spec
+        cooldowns[field] = value * unit
+    return cooldowns
+
 def setup_telegram_notifications(config):
     """Setup Telegram bot notifications"""
-    config["notifications"]["type"] = "telegram"
+    notifications = config["notifications"]
+    notifications["type"] = "telegram"
     print(f"\n🤖 TELEGRAM BOT SETUP")
     print("Step 1: Create a bot")
     print("  - Message @BotFather on Telegram")
@@ -481,17 +653,18 @@ def setup_telegram_notifications(config):
     
     bot_token = input(f"\nEnter your bot token: ").strip()
     if bot_token:
-        config["notifications"]["telegram"]["bot_token"] = bot_token
+        notifications["telegram"]["bot_token"] = bot_token
     
     chat_id = input("Enter your chat ID: ").strip()
     if chat_id:
-        config["notifications"]["telegram"]["chat_id"] = chat_id
+        notifications["telegram"]["chat_id"] = chat_id
     
     return config
 
 def setup_discord_notifications(config):
     """Setup Discord webhook notifications"""
-    config["notifications"]["type"] = "discord"
+    notifications = config["notifications"]
+    notifications["type"] = "discord"
     print(f"\n💬 DISCORD WEBHOOK SETUP")
     print("Step 1: Go to your Discord server")
     print("Step 2: Go to channel settings → Integrations → Webhooks")
@@ -500,6 +673,12 @@ def setup_discord_notifications(config):
     
     webhook_url = input(f"\nEnter Discord webhook URL: ").strip()
     if webhook_url:
-        config["notifications"]["discord"]["webhook_url"] = webhook_url
+        notifications["discord"]["webhook_url"] = webhook_url
     
-    return config
\ No newline at end of file
+    return config
+
+# Notification method choice -> setup helper (defined after the helpers it references)
+_NOTIFICATION_SETUP = {
+    "1": setup_telegram_notifications,
+    "2": setup_discord_notifications,
+}
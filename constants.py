@@ -13,6 +13,7 @@ Developer: 8roku8.hl + Claude
 VERSION = "1.5.0"
 DEVELOPER = "8roku8.hl" 
 CONFIG_FILE = "lp_monitor_config.json"
+TOKEN_CACHE_FILE = "token_cache.json"  # persisted token metadata, keyed by chain id
 
 # Token symbol mappings for better display
 TOKEN_SYMBOL_MAPPINGS = {
@@ -22,18 +23,25 @@ TOKEN_SYMBOL_MAPPINGS = {
     # Add more mappings as needed
 }
 
-# Known contract addresses for better symbol detection
-KNOWN_TOKENS = {
-    # Add known token addresses and their preferred symbols here
-    # "0x...": "HYPE",
-    # "0x...": "USDT", 
+# Known token contracts; their metadata is immutable, so it is served without any RPC call
+STATIC_TOKEN_DEFINITIONS = {
+    # Checksummed address -> {"symbol", "decimals", "name"}
+    "0x5555555555555555555555555555555555555555": {"symbol": "WHYPE", "decimals": 18, "name": "Wrapped HYPE"},
+    # "0x...": {"symbol": "USDT", "decimals": 6, "name": "Tether USD"},
 }
 
+SCHEMA_VERSION = 5  # bump whenever DEFAULT_CONFIG gains or changes keys, so saved configs get re-merged
+
 # Default configuration with smart notification system + fee tracking + Rich UI + PnL/IL
 DEFAULT_CONFIG = {
     "version": VERSION,
+    "schema_version": SCHEMA_VERSION,
     "wallet_address": "",
     "rpc_url": "https://rpc.hyperliquid.xyz/evm",
+    "rpc_batch_size": 100,                # Max eth_calls per JSON-RPC batch request
+    "rpc_pool_maxsize": 64,               # Max pooled HTTP connections to the RPC
+    "rpc_rpm_limit": 90,                  # Max RPC requests per minute (0 disables throttling)
+    "scan_max_workers": 8,                # Max DEXes scanned concurrently
     "dexes": [],
     "check_interval": 30,
     "dynamic_thresholds": {
@@ -93,7 +101,7 @@ DEFAULT_CONFIG = {
 # Common Multicall3 address used on many EVM chains; override in config if needed
 MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
-# Minimal Multicall3 ABI for aggregate
+# Minimal Multicall3 ABI for aggregate, aggregate3 (per-call allowFailure) and getBlockNumber
 MULTICALL3_ABI = [
     {
         "inputs": [
@@ -113,6 +121,39 @@ MULTICALL3_ABI = [
         ],
         "stateMutability": "view",
         "type": "function"
+    },
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "getBlockNumber",
+        "outputs": [{"name": "blockNumber", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
     }
 ]
 
@@ -363,6 +404,42 @@ POSITION_MANAGER_ABI = [
     }
 ]
 
+# Function selectors (first 4 bytes of keccak of the signature) for raw/batched eth_calls
+POSITIONS_SELECTOR = bytes.fromhex("99fbab88")              # positions(uint256)
+TOKEN_OF_OWNER_BY_INDEX_SELECTOR = bytes.fromhex("2f745c59") # tokenOfOwnerByIndex(address,uint256)
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")             # balanceOf(address)
+COLLECT_SELECTOR = bytes.fromhex("fc6f7865")                # collect((uint256,address,uint128,uint128))
+SLOT0_SELECTOR = bytes.fromhex("3850c7bd")                  # slot0()
+GLOBAL_STATE_SELECTOR = bytes.fromhex("e76c01e4")           # globalState()
+TOKEN0_SELECTOR = bytes.fromhex("0dfe1681")                 # token0()
+TOKEN1_SELECTOR = bytes.fromhex("d21220a7")                 # token1()
+DECIMALS_SELECTOR = bytes.fromhex("313ce567")               # decimals()
+SYMBOL_SELECTOR = bytes.fromhex("95d89b41")                 # symbol()
+NAME_SELECTOR = bytes.fromhex("06fdde03")                   # name()
+POOL_BY_PAIR_SELECTOR = bytes.fromhex("d9a641e1")           # poolByPair(address,address) (Algebra factory)
+GET_POOL_SELECTOR = bytes.fromhex("1698ee82")               # getPool(address,address,uint24) (Uniswap V3 factory)
+GET_BLOCK_NUMBER_SELECTOR = bytes.fromhex("42cbb15c")       # getBlockNumber() (Multicall3)
+
+# Event topic hashes (keccak of the event signature) for eth_getLogs filters
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"            # Transfer(address,address,uint256)
+INCREASE_LIQUIDITY_TOPIC = "0x3067048beee31b25b2f1681f88dac838c8bba36af25bfb2b7cf7473a5847e35f"  # IncreaseLiquidity(uint256,uint128,uint256,uint256)
+DECREASE_LIQUIDITY_TOPIC = "0x26f6a048ee9138f2c0ce266f322cb99228e8d619ae2bff30c67f8dcf9d2377b4"  # DecreaseLiquidity(uint256,uint128,uint256,uint256)
+EVENT_REORG_OVERLAP_BLOCKS = 6  # blocks re-read behind the event cursor on each incremental scan
+# Substrings of provider errors meaning "eth_getLogs block range too large"
+LOG_RANGE_ERROR_HINTS = ("block range", "query returned more than", "range limit")
+# Substrings of provider errors meaning "slow down"; never a reason to shrink a range
+RATE_LIMIT_ERROR_HINTS = ("rate limit", "too many requests")
+# Substrings of errors meaning one aggregate3 was too heavy and halves may succeed
+MULTICALL_SPLIT_ERROR_HINTS = ("revert", "out of gas", "gas required exceeds", "response size", "too large")
+
+# Output types for decoding raw eth_call results with eth_abi
+POSITIONS_OUTPUT_TYPES = (
+    "uint96", "address", "address", "address", "uint24", "int24",
+    "int24", "uint128", "uint256", "uint256", "uint128", "uint128"
+)
+COLLECT_INPUT_TYPES = ("(uint256,address,uint128,uint128)",)
+COLLECT_OUTPUT_TYPES = ("uint256", "uint256")
+
 # Factory ABI to get pool addresses
 FACTORY_ABI = [
     {
@@ -8,8 +8,8 @@ Developer: 8roku8.hl
 """
 
 import os
+import sys
 import time
-from datetime import datetime, timedelta
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -25,7 +25,7 @@ from constants import VERSION, DEVELOPER
 from utils import (
     format_price, format_token_amount, format_price_percentage_safe,
     format_fees_display, has_significant_fees, is_full_range_position,
-    calculate_price_based_percentages
+    calculate_price_based_percentages, get_closer_distance_pct
 )
 
 # Try to import price utilities
@@ -54,6 +54,7 @@ class RichDisplayManager:
     
     def __init__(self, config):
         self.config = config
+        self.debug_mode = config.get("display_settings", {}).get("debug_mode", False)
         self.console = Console()
         self.last_update_time = None
         
@@ -138,7 +139,7 @@ class RichDisplayManager:
                         position, status, wallet_address, token_prices
                     )
                 except Exception as e:
-                    if self.config.get("display_settings", {}).get("debug_mode", False):
+                    if self.debug_mode:
                         console.print(f"[yellow]⚠️ PnL calculation error: {e}[/yellow]")
             
             # Format basic info
@@ -211,9 +212,8 @@ class RichDisplayManager:
                         # Add time in position: prefer on-chain acquired timestamp when present
                         hours = pnl_metrics['hours_in_position']
                         if status.get('acquired_timestamp'):
-                            from datetime import datetime
                             try:
-                                onchain_hours = max(0.0, (datetime.now().timestamp() - float(status['acquired_timestamp'])) / 3600)
+                                onchain_hours = max(0.0, (time.time() - float(status['acquired_timestamp'])) / 3600)
                                 hours = max(hours, onchain_hours)
                             except Exception:
                                 pass
@@ -345,8 +345,7 @@ class RichDisplayManager:
         if is_full_range_position(position['tick_lower'], position['tick_upper']):
             return Text("FULL", style="bold cyan")
         
-        range_size = position['tick_upper'] - position['tick_lower']
-        min_distance_pct = min(status['distance_to_lower'], status['distance_to_upper']) / range_size * 100
+        min_distance_pct = get_closer_distance_pct(position, status)
         
         if min_distance_pct < 5:
             return Text("HIGH", style="bold red")
@@ -392,7 +391,7 @@ class RichDisplayManager:
                     total_pnl += pnl_metrics['pnl_usd']
                     total_il += pnl_metrics['il_usd']
                     total_fees += pnl_metrics['total_fees_earned_usd']
-            except:
+            except Exception:
                 continue
         
         if positions_with_data == 0:
@@ -454,7 +453,7 @@ class RichDisplayManager:
         
         # Enhanced footer with all status messages
         footer_text = Text()
-        footer_text.append(f"Last Update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", style="dim")
+        footer_text.append(f"Last Update: {time.strftime('%Y-%m-%d %H:%M:%S')}", style="dim")
         
         # Replace legacy cycle counter with next full rescan ETA if available
         if isinstance(next_full_rescan_s, (int, float)) and next_full_rescan_s is not None and next_full_rescan_s > 0:
@@ -545,6 +544,16 @@ class EnhancedDisplayManager:
             'bold': '\033[1m',
             'end': '\033[0m'
         }
+        if self.config.get("display_settings", {}).get("color_scheme") == "none":
+            self.colors = dict.fromkeys(self.colors, '')  # plain text
+        
+        # Bound once so printing never looks codes up by name
+        self.DANGER = self.colors['danger']
+        self.SAFE = self.colors['safe']
+        self.WARNING = self.colors['warning']
+        self.TEXT = self.colors['text']
+        self.BOLD = self.colors['bold']
+        self.END = self.colors['end']
     
     def c(self, color_name):
         """Get color code for fallback mode"""
@@ -555,12 +564,14 @@ class EnhancedDisplayManager:
         if self.use_rich:
             console.print(self.rich_display.create_header_panel())
         else:
-            print(f"{self.c('bold')}")
-            print("╔══════════════════════════════════════════════════════════════╗")
-            print("║                 💧 HYPEREVM LP MONITOR                       ║")
-            print(f"║                    v{VERSION} by {DEVELOPER}                      ║")
-            print("╚══════════════════════════════════════════════════════════════╝")
-            print(f"{self.c('end')}")
+            sys.stdout.write(
+                f"{self.BOLD}\n"
+                "╔══════════════════════════════════════════════════════════════╗\n"
+                "║                 💧 HYPEREVM LP MONITOR                       ║\n"
+                f"║                    v{VERSION} by {DEVELOPER}                      ║\n"
+                "╚══════════════════════════════════════════════════════════════╝\n"
+                f"{self.END}\n"
+            )
     
     def display_positions(self, positions_with_status, wallet_address, 
                         refresh_countdown=None, notification_sent=False, refresh_cycle=None, is_refreshing=False, next_full_rescan_s=None):
@@ -593,6 +604,8 @@ class EnhancedDisplayManager:
     
     def display_positions_simple(self, positions_with_status):
         """Simple fallback display without Rich"""
+        # Collected and written once: one stdout write per refresh instead of several per position
+        lines = []
         for position, status in positions_with_status:
             if not status:
                 continue
@@ -600,9 +613,9 @@ class EnhancedDisplayManager:
             name = position["name"]
             in_range = "✅ IN RANGE" if status['in_range'] else "❌ OUT OF RANGE"
             
-            print(f"\n📍 {name}")
-            print(f"   Status: {in_range}")
-            print(f"   Price: {format_price(status['current_price'])}")
+            lines.append(f"\n📍 {name}")
+            lines.append(f"   Status: {in_range}")
+            lines.append(f"   Price: {format_price(status['current_price'])}")
             
             # Try to show PnL if database available
             if DATABASE_AVAILABLE and hasattr(self, 'db'):
@@ -611,10 +624,13 @@ class EnhancedDisplayManager:
                         position, status, "wallet", {}
                     )
                     if pnl_metrics:
-                        print(f"   PnL: {format_usd_value(pnl_metrics['pnl_usd'])} ({pnl_metrics['pnl_percent']:+.1f}%)")
-                        print(f"   IL: {format_usd_value(pnl_metrics['il_usd'])} ({pnl_metrics['il_percent']:+.1f}%)")
-                except:
+                        lines.append(f"   PnL: {format_usd_value(pnl_metrics['pnl_usd'])} ({pnl_metrics['pnl_percent']:+.1f}%)")
+                        lines.append(f"   IL: {format_usd_value(pnl_metrics['il_usd'])} ({pnl_metrics['il_percent']:+.1f}%)")
+                except Exception:
                     pass
+        if lines:
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
     
     def print_goodbye(self):
         """Print goodbye message"""
@@ -636,14 +652,19 @@ class EnhancedDisplayManager:
 # For backward compatibility
 DisplayManager = EnhancedDisplayManager
 
+# Windows 10+ consoles interpret ANSI escapes only once VT processing is on;
+# an empty shell command switches it on for this process
+if os.name == 'nt':
+    os.system('')
+
+_CLEAR_SCREEN = "\033[H\033[2J\033[3J"  # cursor home, clear screen, clear scrollback
+
 def clear_screen():
-    """Clear the terminal screen"""
+    """Clear the terminal screen (one escape-sequence write, no cls/clear subprocess)"""
     try:
-        if os.name == 'nt':
-            os.system('cls')
-        else:
-            os.system('clear')
-    except:
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
+    except Exception:
         print('\n' * 50)
 
 def get_color_scheme_from_user():
@@ -16,7 +16,6 @@ Usage:
 
 import argparse
 import sqlite3
-from web3 import Web3
 from datetime import datetime
 import sys
 import os
@@ -24,8 +23,9 @@ import os
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from blockchain import BlockchainManager
+from blockchain import BlockchainManager, to_checksum
 from config import load_config
+from constants import TRANSFER_TOPIC, INCREASE_LIQUIDITY_TOPIC, POSITION_MANAGER_ABI, POSITIONS_SELECTOR
 from price_utils import is_stablecoin
 from utils import tick_to_price
 
@@ -53,8 +53,8 @@ def get_position_creation_block(blockchain, position_manager, token_id, debug=Fa
     # For recent positions, search with conservative range to stay under RPC limit
     search_range = 200  # Conservative block range to avoid rate limiting
     
-    transfer_topic = blockchain.w3.keccak(text="Transfer(address,address,uint256)").hex()
     token_id_topic = '0x' + int(token_id).to_bytes(32, 'big').hex()
+    position_manager = to_checksum(position_manager)
     
     try:
         if debug:
@@ -63,8 +63,8 @@ def get_position_creation_block(blockchain, position_manager, token_id, debug=Fa
         logs = blockchain._rl_call(blockchain.w3.eth.get_logs, {
             'fromBlock': max(0, current_block - search_range),
             'toBlock': 'latest',
-            'address': Web3.to_checksum_address(position_manager),
-            'topics': [transfer_topic, 
+            'address': position_manager,
+            'topics': [TRANSFER_TOPIC, 
                       '0x0000000000000000000000000000000000000000000000000000000000000000',  # from = 0 (mint)
                       None, 
                       token_id_topic]
@@ -85,12 +85,11 @@ def get_position_creation_block(blockchain, position_manager, token_id, debug=Fa
         if debug:
             print(f"  Searching for IncreaseLiquidity events...")
         
-        increase_topic = blockchain.w3.keccak(text="IncreaseLiquidity(uint256,uint128,uint256,uint256)").hex()
         logs = blockchain._rl_call(blockchain.w3.eth.get_logs, {
             'fromBlock': max(0, current_block - search_range),
             'toBlock': 'latest',
-            'address': Web3.to_checksum_address(position_manager),
-            'topics': [increase_topic, token_id_topic]
+            'address': position_manager,
+            'topics': [INCREASE_LIQUIDITY_TOPIC, token_id_topic]
         })
         
         if logs:
@@ -303,31 +302,11 @@ def fix_position_entry(conn, blockchain, wallet, dex, token_id, position_manager
     # Get position data to extract tick range and token information
     try:
         # Get pool data to find pool address
-        position_manager_contract = blockchain.w3.eth.contract(
-            address=Web3.to_checksum_address(position_manager),
-            abi=[{
-                "inputs": [{"name": "tokenId", "type": "uint256"}],
-                "name": "positions",
-                "outputs": [
-                    {"name": "nonce", "type": "uint96"},
-                    {"name": "operator", "type": "address"},
-                    {"name": "token0", "type": "address"},
-                    {"name": "token1", "type": "address"},
-                    {"name": "fee", "type": "uint24"},
-                    {"name": "tickLower", "type": "int24"},
-                    {"name": "tickUpper", "type": "int24"},
-                    {"name": "liquidity", "type": "uint128"},
-                    {"name": "feeGrowthInside0LastX128", "type": "uint256"},
-                    {"name": "feeGrowthInside1LastX128", "type": "uint256"},
-                    {"name": "tokensOwed0", "type": "uint128"},
-                    {"name": "tokensOwed1", "type": "uint128"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            }]
-        )
+        position_manager_contract = blockchain._contract(position_manager, POSITION_MANAGER_ABI)
         
-        position_data = position_manager_contract.functions.positions(token_id).call()
+        position_data = blockchain._decode_positions(
+            blockchain._eth_call_raw(to_checksum(position_manager), POSITIONS_SELECTOR + int(token_id).to_bytes(32, 'big'), "latest")
+        )
         token0 = position_data[2]
         token1 = position_data[3]
         fee = position_data[4]
@@ -339,17 +318,7 @@ def fix_position_entry(conn, blockchain, wallet, dex, token_id, position_manager
             print(f"  Tick range: {tick_lower} to {tick_upper}")
         
         # Get factory address
-        factory_contract = blockchain.w3.eth.contract(
-            address=Web3.to_checksum_address(position_manager),
-            abi=[{
-                "inputs": [],
-                "name": "factory",
-                "outputs": [{"name": "", "type": "address"}],
-                "stateMutability": "view",
-                "type": "function"
-            }]
-        )
-        factory_address = factory_contract.functions.factory().call()
+        factory_address = position_manager_contract.functions.factory().call()
         
         # Get token decimals for price calculations
         token0_info = blockchain.get_enhanced_token_info(token0)
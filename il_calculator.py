@@ -11,7 +11,7 @@ import math
 import json
 import os
 from datetime import datetime
-from utils import tick_to_price, calculate_token_amounts, is_full_range_position
+from utils import tick_to_price, calculate_token_amounts, is_full_range_position, get_closer_distance_pct
 
 class ILCalculator:
     """Calculates Impermanent Loss and provides rebalancing recommendations"""
@@ -233,7 +233,7 @@ class ILCalculator:
         
         # Check if position is close to range edge
         range_size = position['tick_upper'] - position['tick_lower']
-        closer_distance_pct = min(current_status["distance_to_lower"], current_status["distance_to_upper"]) / range_size * 100
+        closer_distance_pct = get_closer_distance_pct(position, current_status)
         
         danger_threshold = self.config.get("dynamic_thresholds", {}).get("danger_threshold_pct", 5.0)
         if current_status["in_range"] and closer_distance_pct < danger_threshold:
@@ -279,8 +279,7 @@ class ILCalculator:
             score -= 40
         
         # Deduct for being close to edges
-        range_size = position['tick_upper'] - position['tick_lower']
-        closer_distance_pct = min(current_status["distance_to_lower"], current_status["distance_to_upper"]) / range_size * 100
+        closer_distance_pct = get_closer_distance_pct(position, current_status)
         if closer_distance_pct < 10:
             score -= (10 - closer_distance_pct) * 2
         
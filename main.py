@@ -9,6 +9,7 @@ Developer: 8roku8.hl
 
 import sys
 import os
+import threading
 
 # Add current directory to path to import local modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -55,8 +56,18 @@ def print_startup_banner():
         print("╚══════════════════════════════════════════════════════════════╝")
         print()
 
+def _preload_monitor_modules():
+    """Import the monitor stack (web3 is most of its ~2s) while config loading and setup run"""
+    try:
+        import position_monitor  # noqa: F401
+    except Exception:
+        pass  # imported again below, where the error is reported
+
 def main():
     """Clean main function with proper error handling and Rich UI support"""
+    # Overlap the slow monitor imports with config I/O and any interactive setup
+    threading.Thread(target=_preload_monitor_modules, daemon=True).start()
+    
     try:
         # Print startup banner
         print_startup_banner()
@@ -75,6 +86,7 @@ def main():
             print("🔧 Loading configuration...")
         
         config = load_config()
+        just_setup = False
         
         if config is None:
             if RICH_AVAILABLE:
@@ -83,6 +95,7 @@ def main():
                 print("🚀 Starting first-time setup...")
             
             config = setup_first_run()
+            just_setup = True
             if config is None:
                 if RICH_AVAILABLE:
                     console.print("[red]❌ Setup cancelled or failed[/red]")
@@ -102,7 +115,8 @@ def main():
         else:
             print("✅ Validating configuration...")
         
-        if not validate_config(config):
+        # DEXes entered during setup were already checked field by field
+        if not validate_config(config, validate_dexes=not just_setup):
             if RICH_AVAILABLE:
                 console.print("[red]❌ Configuration validation failed[/red]")
             else:
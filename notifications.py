@@ -20,7 +20,7 @@ from constants import VERSION
 from utils import (
     format_price, format_token_amount, format_price_percentage_safe,
     calculate_dynamic_thresholds, get_risk_level, calculate_price_based_percentages,
-    is_full_range_position, format_fees_display, has_significant_fees
+    is_full_range_position, format_fees_display, has_significant_fees, get_closer_distance_pct
 )
 
 # Optional USD formatter
@@ -359,8 +359,7 @@ class NotificationManager:
                 continue
             
             # Calculate risk level
-            range_size = position['tick_upper'] - position['tick_lower']
-            closer_distance_pct = min(status["distance_to_lower"], status["distance_to_upper"]) / range_size * 100
+            closer_distance_pct = get_closer_distance_pct(position, status)
             danger_threshold, warning_threshold = calculate_dynamic_thresholds(position, self.config)
             
             # Determine status type
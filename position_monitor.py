@@ -8,7 +8,6 @@ Developer: 8roku8.hl
 """
 
 import time
-from datetime import datetime
 from rich.console import Console
 from rich.live import Live
 from rich.spinner import Spinner
@@ -51,6 +50,7 @@ class EnhancedLPMonitor:
     def __init__(self, config):
         self.config = config
         self.positions = []
+        self._newly_emptied_positions = []
         self.wallet_address = config["wallet_address"]
         
         # Initialize enhanced display manager
@@ -60,9 +60,10 @@ class EnhancedLPMonitor:
             self.display = DisplayManager(config)
             
         self.use_rich = config.get("display_settings", {}).get("use_rich_ui", True)
+        self.clear_screen_enabled = config.get("display_settings", {}).get("clear_screen", True)
         
         # Clear screen and show header
-        if config.get("display_settings", {}).get("clear_screen", True):
+        if self.clear_screen_enabled:
             clear_screen()
         self.display.print_header()
         
@@ -72,13 +73,21 @@ class EnhancedLPMonitor:
         if self.use_rich:
             with console.status("[bold green]Initializing blockchain connection...", spinner="dots"):
                 try:
-                    self.blockchain = BlockchainManager(config["rpc_url"], debug_mode)
+                    self.blockchain = BlockchainManager(
+                        config["rpc_url"], debug_mode, config.get("rpc_batch_size", 100),
+                        pool_maxsize=config.get("rpc_pool_maxsize", 64),
+                        rpm_limit=config.get("rpc_rpm_limit", 90)
+                    )
                 except Exception as e:
                     console.print(f"[red]❌ Failed to initialize blockchain manager: {e}[/red]")
                     raise
         else:
             try:
-                self.blockchain = BlockchainManager(config["rpc_url"], debug_mode)
+                self.blockchain = BlockchainManager(
+                    config["rpc_url"], debug_mode, config.get("rpc_batch_size", 100),
+                    pool_maxsize=config.get("rpc_pool_maxsize", 64),
+                    rpm_limit=config.get("rpc_rpm_limit", 90)
+                )
             except Exception as e:
                 print(f"❌ Failed to initialize blockchain manager: {e}")
                 raise
@@ -159,6 +168,8 @@ class EnhancedLPMonitor:
         """Fetch positions from all DEXes with progress indicator"""
         total_positions = 0
         wallet_address = self.config["wallet_address"]
+        # Concurrent scans would interleave their prints, so they run quietly; force_full
+        # keeps suppress_output from selecting the maintenance (changes-only) path
         
         if self.use_rich:
             with Progress(
@@ -175,18 +186,20 @@ class EnhancedLPMonitor:
                     total=len(self.config["dexes"])
                 )
                 
-                for dex_config in self.config["dexes"]:
-                    progress.update(task, description=f"[cyan]Checking {dex_config['name']}...")
-                    positions = self.blockchain.fetch_positions_from_dex(wallet_address, dex_config)
-                    self.positions.extend(positions)
-                    total_positions += len(positions)
+                def on_done(dex_config):
+                    progress.update(task, description=f"[cyan]Checked {dex_config['name']}...")
                     progress.advance(task)
+
+                results = self._fetch_all_dexes(wallet_address, on_done=on_done, suppress_output=True, force_full=True)
         else:
             print("Fetching LP positions from all DEXes...")
-            for dex_config in self.config["dexes"]:
-                positions = self.blockchain.fetch_positions_from_dex(wallet_address, dex_config)
-                self.positions.extend(positions)
-                total_positions += len(positions)
+            results = self._fetch_all_dexes(wallet_address, suppress_output=True, force_full=True)
+
+        # The scans run concurrently and print nothing; report them in config order
+        for dex_config, positions in results:
+            self._print_scan_summary(dex_config)
+            self.positions.extend(positions or [])
+            total_positions += len(positions or [])
         
         if total_positions == 0:
             msg = "🤔 No LP positions found across any configured DEX"
@@ -195,6 +208,43 @@ class EnhancedLPMonitor:
             else:
                 print(msg)
 
+    def _print_scan_summary(self, dex_config):
+        """One line per DEX from the status its last scan recorded"""
+        name = dex_config['name']
+        status = self.blockchain.get_last_scan_status(name) or {}
+        line = (f"{name} ({dex_config.get('type', 'uniswap_v3')}): {status.get('expected', 0)} LP NFT(s), "
+                f"{status.get('fetched', 0)} active, {status.get('skipped_empty', 0)} empty positions skipped")
+        if self.use_rich:
+            if status.get('had_errors'):
+                console.print(f"[yellow]{line} (scan had errors)[/yellow]")
+            else:
+                console.print(f"[white]{line}[/white]")
+        else:
+            print(f"{line} (scan had errors)" if status.get('had_errors') else line)
+
+    def _fetch_all_dexes(self, wallet_address, on_done=None, **kwargs):
+        """Scan every configured DEX concurrently.
+
+        The scans are IO-bound (waiting on RPC), so they run in a thread pool
+        sized by "scan_max_workers"; the shared rate limiter in BlockchainManager
+        still bounds the request rate.
+        Returns [(dex_config, positions)] in config order.
+        """
+        dexes = self.config["dexes"]
+        if not dexes:
+            return []
+
+        def worker(dex_config):
+            try:
+                return self.blockchain.fetch_positions_from_dex(wallet_address, dex_config, **kwargs)
+            finally:
+                if on_done:
+                    on_done(dex_config)
+
+        max_workers = max(1, min(int(self.config.get("scan_max_workers", 8)), len(dexes)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(zip(dexes, executor.map(worker, dexes)))
+
     def monitor_positions(self):
         """Main monitoring loop with Rich Live display and integrated status messages"""
         if self.use_rich:
@@ -311,14 +361,9 @@ class EnhancedLPMonitor:
                         cycles_since_full_rescan = 0 if force_full else cycles_since_full_rescan
                         is_refreshing = False
                     
-                    # Handle zero liquidity detection (immediate refresh)
-                    zero_liquidity_detected = False
-                    for position, status in positions_with_status:
-                        if status:
-                            live_liquidity = self.blockchain.get_live_liquidity(position)
-                            if live_liquidity == 0:
-                                zero_liquidity_detected = True
-                                break
+                    # Handle zero liquidity detection (immediate refresh); the batched
+                    # check above records positions that just dropped to zero
+                    zero_liquidity_detected = bool(self._newly_emptied_positions)
                     
                     if zero_liquidity_detected:
                         self.refresh_positions(silent=True)
@@ -374,7 +419,7 @@ class EnhancedLPMonitor:
                 
                 # Display with integrated status messages
                 if self.use_rich:
-                    if self.config.get("display_settings", {}).get("clear_screen", True):
+                    if self.clear_screen_enabled:
                         clear_screen()
                     
                     # Display using Rich UI with status messages
@@ -388,7 +433,7 @@ class EnhancedLPMonitor:
                     )
                 else:
                     # Fallback to simple display
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
                     status_line = f"{timestamp}"
                     
                     if refresh_countdown:
@@ -414,7 +459,7 @@ class EnhancedLPMonitor:
                     is_refreshing = True
                     if self.use_rich:
                         # Render a cycle with the refreshing flag on
-                        if self.config.get("display_settings", {}).get("clear_screen", True):
+                        if self.clear_screen_enabled:
                             clear_screen()
                         self.display.display_positions(
                             positions_with_status,
@@ -444,17 +489,15 @@ class EnhancedLPMonitor:
                     is_refreshing = False
                 
                 # Handle zero liquidity detection (immediate refresh)
+                # (the batched check above records positions that just dropped to zero)
                 zero_liquidity_detected = False
-                for position, status in positions_with_status:
-                    if status:
-                        live_liquidity = self.blockchain.get_live_liquidity(position)
-                        if live_liquidity == 0:
-                            zero_liquidity_detected = True
-                            if self.use_rich:
-                                console.print(f"[yellow]{position['name']} on {position['dex_name']} now has zero liquidity[/yellow]")
-                            else:
-                                print(f"{position['name']} on {position['dex_name']} now has zero liquidity")
-                            break
+                for position in self._newly_emptied_positions:
+                    zero_liquidity_detected = True
+                    if self.use_rich:
+                        console.print(f"[yellow]{position['name']} on {position['dex_name']} now has zero liquidity[/yellow]")
+                    else:
+                        print(f"{position['name']} on {position['dex_name']} now has zero liquidity")
+                    break
                 
                 if zero_liquidity_detected:
                     if self.use_rich:
@@ -492,7 +535,38 @@ class EnhancedLPMonitor:
     def check_all_positions_batch(self):
         """Check all positions and return status data"""
         positions_with_status = []
-        
+
+        # One block number per tick; pool data is reused until the chain moves
+        self.blockchain.refresh_block_number()
+
+        # Live liquidity for every position in one batched positions() round-trip
+        live_liquidities = self.blockchain.get_live_liquidity_bulk(self.positions)
+        self._newly_emptied_positions = []
+        for pos, live_liquidity in zip(self.positions, live_liquidities):
+            if live_liquidity == 0 and pos.get("liquidity"):
+                self._newly_emptied_positions.append(pos)
+            pos["liquidity"] = live_liquidity
+        active_positions = [p for p in self.positions if p["liquidity"] != 0]
+        if not active_positions:
+            return positions_with_status
+
+        # Pre-fetch unique pools via multicall to warm the cache
+        unique_pools = {(p.get('pool_address'), p.get('dex_type', 'uniswap_v3')) for p in active_positions if p.get('pool_address')}
+        try:
+            self.blockchain.prefetch_pool_data(list(unique_pools))
+        except Exception:
+            pass
+
+        # Fetch unclaimed fees for every position in one batched round-trip
+        try:
+            fee_list = self.blockchain.get_unclaimed_fees_bulk(active_positions, self.wallet_address)
+        except Exception:
+            fee_list = [None] * len(active_positions)
+
+        def worker(pos, fee_data):
+            status = self.blockchain.check_position_status(pos, self.wallet_address, fee_data=fee_data)
+            return (pos, status) if status else None
+
         if self.use_rich and len(self.positions) > 5:
             # Show progress for many positions
             with Progress(
@@ -506,27 +580,12 @@ class EnhancedLPMonitor:
                 
                 task = progress.add_task(
                     "[cyan]Checking positions...", 
-                    total=len(self.positions)
+                    total=len(active_positions)
                 )
-                
-                def worker(pos):
-                    live_liquidity = self.blockchain.get_live_liquidity(pos)
-                    if live_liquidity == 0:
-                        return None
-                    pos["liquidity"] = live_liquidity
-                    status = self.blockchain.check_position_status(pos, self.wallet_address)
-                    return (pos, status) if status else None
-
-                # Pre-fetch unique pools via multicall to warm the cache
-                unique_pools = {(p.get('pool_address'), p.get('dex_type', 'uniswap_v3')) for p in self.positions if p.get('pool_address')}
-                try:
-                    self.blockchain.prefetch_pool_data(list(unique_pools))
-                except Exception:
-                    pass
 
-                max_workers = min(16, max(4, len(self.positions)//2))
+                max_workers = min(16, max(4, len(active_positions)//2))
                 with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    futures = [executor.submit(worker, p) for p in self.positions]
+                    futures = [executor.submit(worker, p, f) for p, f in zip(active_positions, fee_list)]
                     for fut in as_completed(futures):
                         result = fut.result()
                         if result:
@@ -534,24 +593,9 @@ class EnhancedLPMonitor:
                         progress.advance(task)
         else:
             # Simple check without progress bar
-            def worker(pos):
-                live_liquidity = self.blockchain.get_live_liquidity(pos)
-                if live_liquidity == 0:
-                    return None
-                pos["liquidity"] = live_liquidity
-                status = self.blockchain.check_position_status(pos, self.wallet_address)
-                return (pos, status) if status else None
-
-            # Pre-fetch unique pools via multicall to warm the cache
-            unique_pools = {(p.get('pool_address'), p.get('dex_type', 'uniswap_v3')) for p in self.positions if p.get('pool_address')}
-            try:
-                self.blockchain.prefetch_pool_data(list(unique_pools))
-            except Exception:
-                pass
-
-            max_workers = min(8, max(2, len(self.positions)//2))
+            max_workers = min(8, max(2, len(active_positions)//2))
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                for result in executor.map(worker, self.positions):
+                for result in executor.map(worker, active_positions, fee_list):
                     if result:
                         positions_with_status.append(result)
         
@@ -571,13 +615,12 @@ class EnhancedLPMonitor:
         wallet_address = self.config["wallet_address"]
         had_errors_any = False
 
-        for dex_config in self.config["dexes"]:
-            positions = self.blockchain.fetch_positions_from_dex(
-                wallet_address,
-                dex_config,
-                suppress_output=True,
-                force_full=not silent
-            )
+        results = self._fetch_all_dexes(
+            wallet_address,
+            suppress_output=True,
+            force_full=not silent
+        )
+        for dex_config, positions in results:
             if positions is None and silent:
                 # Maintenance refresh with no detected changes or log failure: keep previous positions for this DEX
                 prev = [p for p in old_positions_list if p.get('dex_name') == dex_config.get('name')]
@@ -668,9 +711,9 @@ class EnhancedLPMonitor:
 
         # Collect active positions (liquidity > 0)
         active_keys = []  # list of (wallet, dex_name, token_id)
-        for pos in self.positions:
+        live_liquidities = self.blockchain.get_live_liquidity_bulk(self.positions)
+        for pos, live_liquidity in zip(self.positions, live_liquidities):
             try:
-                live_liquidity = self.blockchain.get_live_liquidity(pos)
                 if live_liquidity and float(live_liquidity) > 0:
                     dex_name = pos.get("dex_name")
                     token_id = pos.get("token_id")
@@ -696,13 +739,32 @@ class EnhancedLPMonitor:
             try:
                 pdb = PositionDatabase(db_path)
                 # Minimize on-chain calls by checking status only for active positions
+                seed_positions = []
                 for pos in self.positions:
                     key = (self.wallet_address, pos.get("dex_name"), int(pos.get("token_id")) if pos.get("token_id") is not None else None)
-                    if key not in seen:
-                        continue
-                    # Fetch status to derive initial entry amounts if needed
+                    if key in seen:
+                        seed_positions.append(pos)
+                # Fees for all of them in one batched round-trip
+                try:
+                    fee_list = self.blockchain.get_unclaimed_fees_bulk(seed_positions, self.wallet_address)
+                except Exception:
+                    fee_list = [None] * len(seed_positions)
+                # Statuses (cold entry/acquisition lookups) are fetched concurrently;
+                # the database writes stay on this thread
+                def seed_status(pos, fee_data):
+                    try:
+                        return self.blockchain.check_position_status(pos, self.wallet_address, fee_data=fee_data)
+                    except Exception:
+                        return None
+
+                statuses = []
+                if seed_positions:
+                    max_workers = min(8, max(2, len(seed_positions)//2))
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        statuses = list(executor.map(seed_status, seed_positions, fee_list))
+                for pos, status in zip(seed_positions, statuses):
+                    # Use status to derive initial entry amounts if needed
                     try:
-                        status = self.blockchain.check_position_status(pos, self.wallet_address)
                         if status:
                             # Record snapshot first to ensure symbols exist for fixer
                             pdb.record_position_snapshot(pos, status, self.wallet_address, token_prices=None)
@@ -6,14 +6,16 @@ Helper functions for calculating USD values from LP positions
 Version: 1.5.0
 """
 
+# Upper-cased once so lookups are a single set membership test
+STABLECOIN_SYMBOLS = frozenset(s.upper() for s in (
+    'USDC', 'USDT', 'USD₮0', 'USDe', 'DAI', 'BUSD', 'TUSD', 'FRAX',
+    'USDD', 'GUSD', 'USDP', 'SUSD', 'LUSD', 'UST', 'CUSD', 'USDN',
+    'RSV', 'MUSD', 'USDX', 'USDK', 'USDS', 'DUSD', 'USD', 'USDJ'
+))
+
 def is_stablecoin(token_symbol):
     """Check if a token is a stablecoin"""
-    stablecoins = [
-        'USDC', 'USDT', 'USD₮0', 'USDe', 'DAI', 'BUSD', 'TUSD', 'FRAX',
-        'USDD', 'GUSD', 'USDP', 'SUSD', 'LUSD', 'UST', 'CUSD', 'USDN',
-        'RSV', 'MUSD', 'USDX', 'USDK', 'USDS', 'DUSD', 'USD', 'USDJ'
-    ]
-    return token_symbol.upper() in [s.upper() for s in stablecoins]
+    return token_symbol.upper() in STABLECOIN_SYMBOLS
 
 def extract_token_prices_from_positions(positions_with_status):
     """Extract approximate USD prices for tokens from position data"""
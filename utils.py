@@ -10,8 +10,18 @@ Developer: 8roku8.hl
 """
 
 import math
+from functools import lru_cache
 from constants import TOKEN_SYMBOL_MAPPINGS
 
+# Powers of ten for token decimals (ERC-20 decimals fit in this range in practice)
+POW10 = tuple(10 ** i for i in range(40))
+
+def pow10(exponent):
+    """10**exponent, from the precomputed table when possible"""
+    if 0 <= exponent < len(POW10):
+        return POW10[exponent]
+    return 10 ** exponent
+
 def calculate_token_amounts(liquidity, current_tick, lower_tick, upper_tick, decimals0, decimals1):
     """Calculate actual token amounts from liquidity using Uniswap V3 formulas"""
     try:
@@ -35,8 +45,8 @@ def calculate_token_amounts(liquidity, current_tick, lower_tick, upper_tick, dec
             amount1 = liquidity * (sqrt_current - sqrt_lower)
         
         # Convert from wei to actual token amounts
-        amount0_human = amount0 / (10 ** decimals0)
-        amount1_human = amount1 / (10 ** decimals1)
+        amount0_human = amount0 / pow10(decimals0)
+        amount1_human = amount1 / pow10(decimals1)
         
         return amount0_human, amount1_human
         
@@ -60,8 +70,8 @@ def calculate_theoretical_amounts(liquidity, lower_tick, upper_tick, decimals0,
         amount1 = liquidity * (sqrt_center - sqrt_lower)
         
         # Convert from wei to actual token amounts
-        amount0_human = amount0 / (10 ** decimals0)
-        amount1_human = amount1 / (10 ** decimals1)
+        amount0_human = amount0 / pow10(decimals0)
+        amount1_human = amount1 / pow10(decimals1)
         
         return amount0_human, amount1_human
         
@@ -81,7 +91,7 @@ def sqrt_price_to_price(sqrt_price_x96, decimals0, decimals1):
         price = sqrt_price ** 2
         
         # Adjust for token decimals (price of token1 in terms of token0)
-        decimal_adjustment = 10 ** (decimals0 - decimals1)
+        decimal_adjustment = pow10(decimals0 - decimals1)
         adjusted_price = price * decimal_adjustment
         
         return adjusted_price
@@ -97,7 +107,7 @@ def tick_to_price(tick, decimals0, decimals1):
         # Uniswap V3 tick range is approximately ±887,272
         if abs(tick) > 800000:  # Near the limits
             if tick > 800000:
-                return float('inf')  # Effectively infinite price
+                return math.inf  # Effectively infinite price
             else:
                 return 0.0  # Effectively zero price
         
@@ -105,7 +115,7 @@ def tick_to_price(tick, decimals0, decimals1):
         price = (1.0001 ** tick)
         
         # Adjust for token decimals (price of token1 in terms of token0)  
-        decimal_adjustment = 10 ** (decimals0 - decimals1)
+        decimal_adjustment = pow10(decimals0 - decimals1)
         adjusted_price = price * decimal_adjustment
         
         return adjusted_price
@@ -121,9 +131,9 @@ def calculate_price_based_percentages(current_price, lower_price, upper_price):
             return 0, 0
         
         # Check for full-range or extreme positions
-        if lower_price == 0 or upper_price == float('inf') or (upper_price / lower_price) > 1e10:
+        if lower_price == 0 or upper_price == math.inf or (upper_price / lower_price) > 1e10:
             # This is effectively a full-range position
-            return float('inf'), float('inf')  # Special marker for full range
+            return math.inf, math.inf  # Special marker for full range
         
         # Distance to lower bound (negative = price needs to drop)
         lower_move_pct = (current_price - lower_price) / current_price * 100
@@ -134,7 +144,7 @@ def calculate_price_based_percentages(current_price, lower_price, upper_price):
         return lower_move_pct, upper_move_pct
         
     except (ZeroDivisionError, ValueError, OverflowError):
-        return float('inf'), float('inf')  # Treat as full range on any calculation error
+        return math.inf, math.inf  # Treat as full range on any calculation error
 
 def calculate_dynamic_thresholds(position, config):
     """Calculate position-specific thresholds based on range characteristics"""
@@ -156,6 +166,14 @@ def calculate_dynamic_thresholds(position, config):
     
     return danger_pct, warning_pct
 
+def get_closer_distance_pct(position, status):
+    """Distance to the nearer range edge as % of range width (precomputed by check_position_status)"""
+    closer_distance_pct = status.get("closer_distance_pct")
+    if closer_distance_pct is None:
+        range_size = position['tick_upper'] - position['tick_lower']
+        closer_distance_pct = min(status["distance_to_lower"], status["distance_to_upper"]) / range_size * 100
+    return closer_distance_pct
+
 def get_risk_level(position, closer_distance_pct, config):
     """Determine risk level using dynamic thresholds"""
     # Check if this is a full-range position first
@@ -176,7 +194,7 @@ def format_price(price):
     if price == 0:
         return "$0.00000000"
     
-    if price == float('inf'):
+    if price == math.inf:
         return "∞ (No Upper Limit)"
     
     if price < 0:
@@ -200,19 +218,21 @@ def format_price(price):
     else:
         return "$~0 (Near Zero)"
 
+# Uniswap V3/Algebra tick limits are approximately ±887,272
+# Consider positions within 10,000 ticks of the limits as "full range"
+FULL_RANGE_TICK_LIMIT = 877272  # Slightly below actual limit for safety
+FULL_RANGE_TICK_SPAN = 1700000
+
 def is_full_range_position(tick_lower, tick_upper):
     """Detect if a position is full-range or near full-range"""
-    # Uniswap V3/Algebra tick limits are approximately ±887,272
-    # Consider positions within 10,000 ticks of the limits as "full range"
-    TICK_LIMIT = 877272  # Slightly below actual limit for safety
-    
-    return (tick_lower <= -TICK_LIMIT and tick_upper >= TICK_LIMIT) or (tick_upper - tick_lower) > 1700000
+    return ((tick_lower <= -FULL_RANGE_TICK_LIMIT and tick_upper >= FULL_RANGE_TICK_LIMIT)
+            or (tick_upper - tick_lower) > FULL_RANGE_TICK_SPAN)
 
 def format_price_percentage_safe(percentage):
     """Format price movement percentages with proper +/- signs and overflow protection"""
-    if percentage == float('inf'):
+    if percentage == math.inf:
         return "∞% (Full Range)"
-    elif percentage == float('-inf'):
+    elif percentage == -math.inf:
         return "-∞% (Full Range)"
     elif abs(percentage) > 1e10:
         return f"{percentage:.1e}% (Extreme)"
@@ -276,6 +296,7 @@ def has_significant_fees(fee_amount0, fee_amount1, threshold=0.00001):
     """Check if fees are significant enough to display"""
     return fee_amount0 >= threshold or fee_amount1 >= threshold
 
+@lru_cache(maxsize=1024)
 def apply_symbol_mapping(symbol):
     """Apply symbol mapping (e.g., WHYPE -> HYPE)"""
     # Apply symbol mapping from constants